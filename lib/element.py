@@ -5,11 +5,13 @@ Ce module définit les éléments de la grille du labyrinthe.
 
 - les classes *Mix-In* ``Decryptable``, ``Decrypte``, ``Defaut``, ``Traversable``, ``Gagnable``, ``Demarrable``,
   ``Transformable``, ``Murable``, ``Percable``
+- les constantes de caractéristiques ``caracteristique_decrypte``, ``caracteristique_traversable``,
+  ``caracteristique_gagnable``, ``caracteristique_demarrable``, ``caracteristique_transformable``
 - la metaclasse ``Elements``
 - les classes ``Element``, ``Porte``, ``Mur``, ``Sortie``, ``Sol``, ``Robot``, ``Adversaire``
 """
 
-from typing import Dict, Type, Tuple, Any, final, cast
+from typing import Dict, Type, Tuple, Any, Final, final, cast
 from abc import ABCMeta
 
 # Alias de types
@@ -94,6 +96,15 @@ class Percable(Transformable, metaclass=ABCMeta):
     description = "percer"
 
 
+# Chaque classe *Mix-In* est codée par un bit. ``Element.caracteristiques`` combine les bits des classes dont dérive
+# l'élément: ``issubclass(element, Traversable)`` équivaut à ``element.caracteristiques & caracteristique_traversable``.
+caracteristique_decrypte: Final[int] = 0b00001
+caracteristique_traversable: Final[int] = 0b00010
+caracteristique_gagnable: Final[int] = 0b00100
+caracteristique_demarrable: Final[int] = 0b01000
+caracteristique_transformable: Final[int] = 0b10000
+
+
 class Elements(ABCMeta):
     """
     Métaclasse qui stocke les informations des classes créées dans:
@@ -101,8 +112,15 @@ class Elements(ABCMeta):
     - ``decryptable``, caractères reconnus à la lecture d'une carte et associés aux classes d'éléments.
     - ``gagnable``, caractères et leurs éléments associés qui font gagner la partie.
     - ``obstacle_par_defaut``, élément appelé si la grille du labyrinthe n'en définit aucun.
+
+    Elle calcule également l'attribut ``caracteristiques`` de chaque classe créée depuis les bits de ``bits_mix_in``.
     """
 
+    bits_mix_in: Dict[type, int] = {Decrypte: caracteristique_decrypte,
+                                    Traversable: caracteristique_traversable,
+                                    Gagnable: caracteristique_gagnable,
+                                    Demarrable: caracteristique_demarrable,
+                                    Transformable: caracteristique_transformable}
     decryptable: Dict[SymboleCarte, Type['Element']] = {}
     gagnable: Dict[SymboleCarte, Type['Element']] = {}
     obstacle_par_defaut: Type['Element']
@@ -111,6 +129,7 @@ class Elements(ABCMeta):
     def __new__(mcs, nom: str, bases: Tuple[Any, ...], dictionnaire: Dict[str, Any]) -> 'Elements':
         """
         Crée la classe d'élément et ajoute ses informations aux variables de classe en fonction des classes héritées.
+        Combine les bits des classes *Mix-In* héritées dans l'attribut ``caracteristiques`` de la classe.
 
         :param nom: nom de la classe d'élément.
         :param bases: classes héritées.
@@ -126,6 +145,10 @@ class Elements(ABCMeta):
                 mcs.gagnable[dictionnaire["symbole_carte"]] = classe
             if issubclass(base, Defaut):
                 mcs.obstacle_par_defaut = classe
+        classe.caracteristiques = 0
+        for mix_in, bit in mcs.bits_mix_in.items():
+            if issubclass(classe, mix_in):
+                classe.caracteristiques |= bit
         return cast('Elements', classe)
 
     def __str__(self) -> SymboleAffichage:
@@ -177,6 +200,7 @@ class Element(metaclass=Elements):
 
     symbole_affichage: SymboleAffichage = str()
     description: str
+    caracteristiques: int = 0
 
 
 @final
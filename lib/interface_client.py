@@ -163,6 +163,7 @@ class InterfaceServeur(threading.Thread, Transmission):
         """
         Instancie le Thread *Interface Serveur*.
         Hérite de la classe ``Transmission`` qui nécessite une socket pour recevoir les messages réseau.
+        Désactive l'algorithme de Nagle sur la socket.
 
         :param request: la requête.
         """
@@ -170,6 +171,7 @@ class InterfaceServeur(threading.Thread, Transmission):
         super().__init__()
         self.name = 'Interface Serveur'
         self.request = request
+        self.desactiver_nagle()
 
     def run(self) -> None:
         """
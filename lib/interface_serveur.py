@@ -64,10 +64,12 @@ class RequestHandler(socketserver.BaseRequestHandler, Transmission):
 
     def setup(self) -> None:
         """
+        Désactive l'algorithme de Nagle sur la socket du client.
         Informe *Main Thread* d'un nouveau joueur par la classe ``Messagerie``.
         Exécute ensuite ``handle()``.
         """
 
+        self.desactiver_nagle()
         Messagerie.ajouter((self, 'nouveau_joueur', None))
 
     def handle(self) -> None:
@@ -16,6 +16,20 @@ Grille = Dict[Coordonnees, element.Obstacle]
 Categorie = str
 Message = Optional[str]
 Datagramme = Tuple[Any, Categorie, Message]
+Fond = Tuple[Coordonnees, List[str]]
+
+# Catégories des datagrammes transmis aux clients réseau
+categorie_affichage: Final[Categorie] = 'affichage'
+categorie_validation_schema: Final[Categorie] = 'validation_schema'
+categorie_validation_erreur: Final[Categorie] = 'validation_erreur'
+categorie_fin: Final[Categorie] = 'fin'
+
+# Représentations du joueur et de ses adversaires sur le plateau
+# Le plateau est composé d'un caractère par position : chaque représentation doit mesurer un seul caractère
+symbole_robot: Final[str] = str(element.Robot)
+symbole_adversaire: Final[str] = str(element.Adversaire)
+if len(symbole_robot) != 1 or len(symbole_adversaire) != 1:
+    raise ValueError("Les représentations du joueur et de ses adversaires doivent mesurer un seul caractère")
 
 
 class Labyrinthe:
@@ -141,7 +155,7 @@ class Labyrinthe:
 
         Depuis les sorties,
         liste les positions accessibles par recursion selon les déplacements définis dans la classe ``Mouvement``.
-        Teste si la position atteinte ne l'a pas déjà été précédemment (présence dans ``liste_positions``).
+        Teste si la position atteinte ne l'a pas déjà été précédemment (clé du dictionnaire ``liste_positions``).
         Identifie l'élément du labyrinthe dans la grille (ou utilise ``obstacle_par_defaut`` si absent de la grille).
 
         - si l'élément est ``Demarrable``, stocke ce départ possible et ajoute les coordonnées à une distance +1 de la position
@@ -153,28 +167,29 @@ class Labyrinthe:
         Mélange aléatoirement les départs possibles iso-distants des sorties et les ajoute dans ``departs``.
         """
         coordonnees_min, coordonnees_max = self._dimensionner()
+        directions = tuple(controle.Mouvement.directions)
+        grille = self.grille
+        obstacle_par_defaut = element.Elements.obstacle_par_defaut
+        demarrable, traversable, transformable = element.Demarrable, element.Traversable, element.Transformable
         liste_positions = {sortie: 0 for sortie in self.sorties}
         distance = 0
-        while [position for position, indice in liste_positions.items() if indice >= distance]:
+        while any(indice >= distance for indice in liste_positions.values()):
             departs: List[Coordonnees] = []
             positions_testees = [position for position, indice in liste_positions.items() if indice == distance]
-            for position_testee in positions_testees:
-                for direction in controle.Mouvement.directions:
-                    coordonnees = (position_testee[0] + direction[0], position_testee[1] + direction[1])
+            for abscisse_testee, ordonnee_testee in positions_testees:
+                for direction in directions:
+                    coordonnees = (abscisse_testee + direction[0], ordonnee_testee + direction[1])
                     if coordonnees_min[0] <= coordonnees[0] <= coordonnees_max[0] \
                             and coordonnees_min[1] <= coordonnees[1] <= coordonnees_max[1]:
-                        if coordonnees not in [*liste_positions]:
-                            try:
-                                terrain = cast(Type[element.Element], self.grille[coordonnees])
-                            except KeyError:
-                                terrain = element.Elements.obstacle_par_defaut
-                            if issubclass(terrain, element.Demarrable):
+                        if coordonnees not in liste_positions:
+                            terrain = cast(Type[element.Element], grille.get(coordonnees, obstacle_par_defaut))
+                            if issubclass(terrain, demarrable):
                                 liste_positions[coordonnees] = distance + 1
                                 departs.append(coordonnees)
-                            elif issubclass(terrain, element.Traversable):
+                            elif issubclass(terrain, traversable):
                                 liste_positions[coordonnees] = distance + 1
-                            elif issubclass(terrain, element.Transformable):
-                                if issubclass(terrain.transformee, element.Traversable):
+                            elif issubclass(terrain, transformable):
+                                if issubclass(terrain.transformee, traversable):
                                     liste_positions[coordonnees] = distance + 2
             if departs:
                 shuffle(departs)
@@ -208,44 +223,66 @@ class Labyrinthe:
             max_abscisse, max_ordonnee = 0, 0
         return (min_abscisse, min_ordonnee), (max_abscisse, max_ordonnee)
 
-    def _afficher_plateau(self, joueur: Optional[Joueur] = None) -> str:
+    def _dessiner_fond(self) -> Fond:
+        """
+        Représente les éléments de la grille sur toute l'étendue du plateau, sans la position des joueurs.
+
+        Pour chaque position (abscisse et ordonnée) du plateau, teste si les coordonnées sont celle d'un élément de la grille.
+        Ajoute la représentation ``__str__()`` de l'``Element`` à la ligne du plateau.
+        Les représentations des éléments de la grille sont calculées une seule fois par appel, et doivent mesurer un seul
+        caractère: ``_afficher_plateau()`` place les joueurs sur le fond à l'indice de leur abscisse.
+
+        :return: coordonnées du coin supérieur gauche du plateau et lignes du plateau.
+        :raises ValueError: si la représentation d'un élément ne mesure pas un seul caractère.
+        """
+
+        coordonnees_min, coordonnees_max = self._dimensionner()
+        symbole_defaut = str(element.Elements.obstacle_par_defaut)
+        symboles = {obstacle: str(obstacle) for obstacle in set(self.grille.values())}
+        if any(len(symbole) != 1 for symbole in (symbole_defaut, *symboles.values())):
+            raise ValueError("La représentation d'un élément doit mesurer un seul caractère")
+        lignes: List[str] = []
+        for ordonnee in range(coordonnees_min[1], coordonnees_max[1] + 1):
+            ligne: List[str] = []
+            for abscisse in range(coordonnees_min[0], coordonnees_max[0] + 1):
+                try:
+                    ligne.append(symboles[self.grille[abscisse, ordonnee]])
+                except KeyError:
+                    ligne.append(symbole_defaut)
+            lignes.append(''.join(ligne))
+        return coordonnees_min, lignes
+
+    def _afficher_plateau(self, joueur: Optional[Joueur] = None, fond: Optional[Fond] = None) -> str:
         """
         Représente le plateau du labyrinthe et la position des joueurs avec une chaîne de caractères.
 
-        Pour chaque position (abscisse et ordonnée) du plateau, si la partie a débuté teste si les coordonnées sont celles du
-        joueur ou d'un adversaire.
-        Teste si les coordonnées sont celle d'un élément de la grille.
-        Ajoute la représentation ``__str__()`` de la classe ``Joueur``, ``Adversaire`` ou ``Element`` au ``plateau``.
+        Le ``fond`` (la grille sans les joueurs) est commun à tous les joueurs : il peut être calculé une seule fois par
+        ``_dessiner_fond()`` et transmis à chaque appel. Sinon, il est calculé.
+        Si la partie a débuté, remplace sur le ``fond`` les positions des adversaires par la représentation ``__str__()`` de
+        la classe ``Adversaire``, puis la position du joueur par celle de la classe ``Robot``.
+        Chaque position du ``fond`` est un caractère : les représentations des éléments, du joueur et des adversaires
+        mesurent toutes un seul caractère.
 
         :param joueur: joueur qui recevra la représentation du plateau.
+        :param fond: représentation de la grille retournée par ``_dessiner_fond()``.
         :return: chaîne de caractères représentant le plateau.
         """
 
-        coordonnees_min, coordonnees_max = self._dimensionner()
-        coordonnees_adversaires: List[Coordonnees] = []
-        coordonnees_joueur: Optional[Coordonnees] = None
+        if fond is None:
+            fond = self._dessiner_fond()
+        coordonnees_min, lignes = fond
         if self.mode >= self.jeu_en_cours and joueur:
-            liste_adversaires = self.liste_joueurs.copy()
-            liste_adversaires.remove(joueur)
-            coordonnees_adversaires = [adversaire.coordonnees for adversaire in liste_adversaires]
-            coordonnees_joueur = joueur.coordonnees
-
-        plateau = str()
-        for ordonnee in range(coordonnees_min[1], coordonnees_max[1] + 1):
-            for abscisse in range(coordonnees_min[0], coordonnees_max[0] + 1):
-                if (abscisse, ordonnee) == coordonnees_joueur:
-                    plateau += str(element.Robot)
-                elif (abscisse, ordonnee) in coordonnees_adversaires:
-                    plateau += str(element.Adversaire)
-                else:
-                    try:
-                        piece = self.grille[abscisse, ordonnee]
-                    except KeyError:
-                        plateau += str(element.Elements.obstacle_par_defaut)
-                    else:
-                        plateau += str(piece)
-            plateau += "\n"
-        return plateau
+            lignes = lignes.copy()
+            positions = [(adversaire.coordonnees, symbole_adversaire)
+                         for adversaire in self.liste_joueurs if adversaire is not joueur]
+            positions.append((joueur.coordonnees, symbole_robot))
+            for (abscisse, ordonnee), symbole in positions:
+                abscisse -= coordonnees_min[0]
+                ordonnee -= coordonnees_min[1]
+                if 0 <= ordonnee < len(lignes) and 0 <= abscisse < len(lignes[ordonnee]):
+                    ligne = lignes[ordonnee]
+                    lignes[ordonnee] = ligne[:abscisse] + symbole + ligne[abscisse + 1:]
+        return ''.join(ligne + "\n" for ligne in lignes)
 
     def _ajouter_joueur(self, identifiant_client: Any, nom: str) -> Optional[Joueur]:
         """
@@ -304,20 +341,22 @@ class Labyrinthe:
         if self.mode < self.fin_de_partie:
             for identifiant_client, joueur in self.dict_client_joueur.items():
                 if self.liste_joueurs[0] == joueur:
-                    self.datagrammes.append((identifiant_client, 'affichage', "C'est à Vous de jouer"))
+                    self.datagrammes.append((identifiant_client, categorie_affichage, "C'est à Vous de jouer"))
                 else:
-                    self.datagrammes.append((identifiant_client, 'affichage',
+                    self.datagrammes.append((identifiant_client, categorie_affichage,
                                              "C'est à " + self.liste_joueurs[0].nom + " de jouer"))
 
     def afficher_plateau(self) -> None:
         """
         Pour chaque joueur ajoute le plateau du labyrinthe selon le format (identifiant_client, categorie, message) à la liste
         ``datagrammes``.
+        La grille est représentée une seule fois, seules les positions des joueurs diffèrent d'un plateau à l'autre.
         """
 
+        fond = self._dessiner_fond()
         for identifiant_client, joueur in self.dict_client_joueur.items():
-            self.datagrammes.append((identifiant_client, 'affichage', self._afficher_plateau(joueur)))
-            self.datagrammes.append((identifiant_client, 'affichage', ""))
+            self.datagrammes.append((identifiant_client, categorie_affichage, self._afficher_plateau(joueur, fond)))
+            self.datagrammes.append((identifiant_client, categorie_affichage, ""))
 
     def ajouter_joueur(self, identifiant_client: Any, nom: str) -> None:
         """
@@ -330,11 +369,11 @@ class Labyrinthe:
         """
 
         if self._ajouter_joueur(identifiant_client, nom):
-            self.datagrammes.append((identifiant_client, 'affichage', ""))
-            self.datagrammes.append((identifiant_client, 'affichage', "Bienvenue, " + nom + "."))
-            self.datagrammes.append((identifiant_client, 'affichage',
+            self.datagrammes.append((identifiant_client, categorie_affichage, ""))
+            self.datagrammes.append((identifiant_client, categorie_affichage, "Bienvenue, " + nom + "."))
+            self.datagrammes.append((identifiant_client, categorie_affichage,
                                      "Vous jouez sur le labyrinthe '" + self.nom_labyrinthe + "'"))
-            self.datagrammes.append((identifiant_client, 'affichage', self._afficher_plateau()))
+            self.datagrammes.append((identifiant_client, categorie_affichage, self._afficher_plateau()))
 
     def effacer_joueur(self, identifiant_client: Any) -> None:
         """
@@ -349,7 +388,7 @@ class Labyrinthe:
         self._effacer_joueur(identifiant_client)
         if self.mode >= self.jeu_en_cours:
             for identifiant_client in self.dict_client_joueur:
-                self.datagrammes.append((identifiant_client, 'affichage', joueur.nom + " a quitté la partie."))
+                self.datagrammes.append((identifiant_client, categorie_affichage, joueur.nom + " a quitté la partie."))
             self.afficher_plateau()
             self.a_qui_de_jouer()
 
@@ -374,12 +413,12 @@ class Labyrinthe:
             indice += 1
 
         for identifiant_client in self.dict_client_joueur:
-            self.datagrammes.append((identifiant_client, 'validation_schema', self.get_validation_controle()))
-            self.datagrammes.append((identifiant_client, 'validation_erreur', "Cette saisie n'est pas valide !"))
-            self.datagrammes.append((identifiant_client, 'affichage',
+            self.datagrammes.append((identifiant_client, categorie_validation_schema, self.get_validation_controle()))
+            self.datagrammes.append((identifiant_client, categorie_validation_erreur, "Cette saisie n'est pas valide !"))
+            self.datagrammes.append((identifiant_client, categorie_affichage,
                                      "La partie commence! Vous êtes " + str(len(self.liste_joueurs)) + " joueurs"))
             for description in controle.Controle.descriptions:
-                self.datagrammes.append((identifiant_client, 'affichage', description))
+                self.datagrammes.append((identifiant_client, categorie_affichage, description))
         self.afficher_plateau()
         self.a_qui_de_jouer()
 
@@ -387,16 +426,17 @@ class Labyrinthe:
         """
         Extrait les commandes depuis la chaîne de caractères saisie par le joueur, et les ajoute à la liste de commandes
         pré-existantes.
+        Si la saisie ne contient aucune commande, aucun message n'est transmis au client réseau.
 
         :param identifiant_client: variable qui associe le joueur au client réseau.
         :param saisie: saisie du client réseau.
         """
 
         commandes = controle.extraire(saisie)
-        joueur = self.dict_client_joueur[identifiant_client]
-        joueur.ajouter_commande(commandes)
-        if joueur.commandes:
-            self.datagrammes.append((identifiant_client, 'affichage', "Commandes :" + ' '.join(commandes)))
+        if not commandes:
+            return
+        self.dict_client_joueur[identifiant_client].ajouter_commande(commandes)
+        self.datagrammes.append((identifiant_client, categorie_affichage, "Commandes :" + ' '.join(commandes)))
 
     def jouer(self) -> None:
         """
@@ -432,7 +472,7 @@ class Labyrinthe:
                 try:
                     regle.verifier_regles(instantane)
                 except regle.HorsRegles as e:
-                    self.datagrammes.append((self.joueur_courant.identifiant_client, 'affichage', str(e)))
+                    self.datagrammes.append((self.joueur_courant.identifiant_client, categorie_affichage, str(e)))
                     self.liste_joueurs.insert(0, self.joueur_courant)
                     self.joueur_courant = None
                     continue
@@ -465,7 +505,7 @@ class Labyrinthe:
 
         for identifiant_client, joueur in self.dict_client_joueur.items():
             if self.vainqueur == joueur:
-                self.datagrammes.append((identifiant_client, 'affichage', "Vous avez gagné la partie !"))
+                self.datagrammes.append((identifiant_client, categorie_affichage, "Vous avez gagné la partie !"))
             elif self.vainqueur:
-                self.datagrammes.append((identifiant_client, 'affichage', self.vainqueur.nom + " a gagné la partie !"))
-            self.datagrammes.append((identifiant_client, 'fin', None))
+                self.datagrammes.append((identifiant_client, categorie_affichage, self.vainqueur.nom + " a gagné la partie !"))
+            self.datagrammes.append((identifiant_client, categorie_fin, None))
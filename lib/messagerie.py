@@ -4,8 +4,9 @@
 Ce module contient les classes ``Transmission`` et ``Messagerie``.
 """
 
-from typing import Any, List, ClassVar
-from socket import socket
+from typing import Any, ClassVar, Deque
+from collections import deque
+from socket import socket, IPPROTO_TCP, TCP_NODELAY
 from abc import ABCMeta
 import pickle
 import threading
@@ -25,7 +26,7 @@ class Transmission:
     Le message comporte:
 
     - une entête de longueur fixe ``longueur_entete`` qui indique la taille de l'objet transmis
-    - l'objet sérialisé avec *pickle*
+    - l'objet sérialisé avec *pickle*, selon le protocole ``protocole``
 
     Idée originale détaillée sur:
     https://pythonprogramming.net/pickle-objects-sockets-tutorial-python-3/
@@ -34,38 +35,103 @@ class Transmission:
     """
 
     longueur_entete: ClassVar[int] = 3     # 3 octets = 24 bits
+    # Protocole fixe: client et serveur peuvent tourner sur des versions différentes de Python, le protocole 4 est lu
+    # par toutes les versions depuis Python 3.4 (dont la 3.8 visée par le projet)
+    protocole: ClassVar[int] = 4
 
     def __init__(self, request: socket) -> None:
         """
         Stocke la socket nécessaire pour envoyer et recevoir des messages entre Client et Serveur.
+        Désactive l'algorithme de Nagle sur la socket.
 
         :param request: connexion client.
         """
 
         self.request = request
+        self.desactiver_nagle()
 
-    def envoyer(self, objet: Any) -> None:
+    def desactiver_nagle(self) -> None:
+        """
+        Désactive l'algorithme de Nagle sur la socket (option ``TCP_NODELAY``) : chaque message est envoyé
+        immédiatement, sans attendre l'accusé de réception du message précédent.
+        Sans effet si la socket n'est pas une socket TCP.
+        """
+
+        try:
+            self.request.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
+        except OSError:
+            pass
+
+    @classmethod
+    def serialiser(cls, objet: Any) -> bytes:
         """
-        Sérialise l'objet avec *pickle*.
+        Sérialise l'objet avec *pickle* selon le protocole ``protocole``.
         Détermine la taille du message à transmettre et l'indique dans l'entête.
-        Envoie le message en utilisant la socket.
 
         :param objet: objet à transmettre.
+        :return: message composé de l'entête et de l'objet sérialisé.
         :raises TypeError: si l'objet ne peut pas être sérialisé.
         :raises OverflowError: si la taille du message ne peut être contenu dans ``longueur_entete``.
         """
 
         # Lève TypeError si l'objet ne peut pas être sérialisé
-        objet_serialise = pickle.dumps(objet)
+        objet_serialise = pickle.dumps(objet, protocol=cls.protocole)
         longueur = len(objet_serialise)
         # Lève OverflowError si longueur dépasse LONGUEUR_ENTETE
-        entete = longueur.to_bytes(length=self.longueur_entete, byteorder='big')
+        entete = longueur.to_bytes(length=cls.longueur_entete, byteorder='big')
+        return entete + objet_serialise
+
+    def envoyer(self, objet: Any) -> None:
+        """
+        Sérialise l'objet avec ``serialiser()``.
+        Envoie le message complet en utilisant la socket (``sendall()`` répète l'envoi tant que tous les octets ne sont pas
+        transmis).
+
+        :param objet: objet à transmettre.
+        :raises TypeError: si l'objet ne peut pas être sérialisé.
+        :raises OverflowError: si la taille du message ne peut être contenu dans ``longueur_entete``.
+        """
+
+        self.envoyer_brut(self.serialiser(objet))
+
+    def envoyer_brut(self, messages: bytes) -> None:
+        """
+        Envoie des messages déjà produits par ``serialiser()`` en utilisant la socket (``sendall()`` répète l'envoi tant
+        que tous les octets ne sont pas transmis).
+        Un même message sérialisé une seule fois peut ainsi être envoyé à plusieurs destinataires.
+
+        :param messages: un ou plusieurs messages (entête et objet sérialisé) concaténés.
+        """
+
+        if not messages:
+            return
         # Lève ConnectionAbortedError si la socket a été fermée par le destinataire
         try:
-            self.request.send(entete + objet_serialise)
+            self.request.sendall(messages)
         except (ConnectionResetError, ConnectionAbortedError, OSError):
             pass
 
+    def __recevoir_octets(self, longueur: int) -> bytearray:
+        """
+        Reçoit ``longueur`` octets directement dans un tampon alloué à la taille attendue.
+        La socket peut retourner moins d'octets que demandé : la lecture est répétée jusqu'à remplir le tampon, ou jusqu'à
+        la fermeture de la connexion par le client distant.
+
+        :param longueur: nombre d'octets à recevoir.
+        :return: octets reçus, moins de ``longueur`` octets si le client distant a fermé la connexion.
+        """
+
+        tampon = bytearray(longueur)
+        recu = 0
+        with memoryview(tampon) as vue:
+            while recu < longueur:
+                nombre = self.request.recv_into(vue[recu:])
+                if not nombre:
+                    break
+                recu += nombre
+        del tampon[recu:]
+        return tampon
+
     def recevoir(self) -> Any:
         """
         Reçoit l'entête de taille ``longueur_entete``.
@@ -73,18 +139,20 @@ class Transmission:
         Dé-sérialise le message avec *pickle* et retourne l'objet.
 
         :return: objet reçu.
-        :raises TypeError: si l'objet ne peut pas être sérialisé.
+        :raises TypeError: si l'objet ne peut pas être sérialisé ou si le message est incomplet.
         :raises ConnectionFermee: si le client distant a fermé la connexion.
         :raises ConnectionResetError: si le client distant a réinitialisé la connexion.
         :raises ConnectionAbortedError: si la socket depuis laquelle le message est reçu est close.
         :raises OSError: si la socket utilisée par la fonction est close.
         """
 
-        entete = self.request.recv(self.longueur_entete)
-        if not entete:
+        entete = self.__recevoir_octets(self.longueur_entete)
+        if len(entete) < self.longueur_entete:
             raise ConnectionFermee
         longueur = int.from_bytes(entete, byteorder='big')
-        objet_serialise = self.request.recv(longueur)
+        objet_serialise = self.__recevoir_octets(longueur)
+        if len(objet_serialise) < longueur:
+            raise TypeError
         try:
             message = pickle.loads(objet_serialise)
         except (pickle.UnpicklingError, EOFError):
@@ -96,17 +164,18 @@ class Messagerie(metaclass=ABCMeta):
     """
     Permet aux différents Threads d'ajouter et de récuperer des messages.
     Averti les Threads de l'arrivée d'un message grâce à l'Event ``nouveau_message``.
-    Les messages sont stockés sur une unique liste ``messages``.
+    Les messages sont stockés sur une unique file ``messages`` (``deque``) qui retire le plus ancien message en temps
+    constant.
     """
 
     nouveau_message: ClassVar[threading.Condition] = threading.Condition()
-    messages: ClassVar[List[Any]] = []
+    messages: ClassVar[Deque[Any]] = deque()
 
     @classmethod
     def ajouter(cls, message: Any) -> None:
         """
-        Utilise le verrou ``nouveau_message`` pour accéder à la liste des messages.
-        Ajoute le message à la liste.
+        Utilise le verrou ``nouveau_message`` pour accéder à la file des messages.
+        Ajoute le message à la file.
         Indique l'arriver d'un message avec ``nouveau_message``.
 
         :param message: message à ajouter à la classe ``Messagerie``.
@@ -119,17 +188,17 @@ class Messagerie(metaclass=ABCMeta):
     @classmethod
     def obtenir(cls) -> Any:
         """
-        Utilise le verrou ``nouveau_message`` pour accéder à la liste des messages.
+        Utilise le verrou ``nouveau_message`` pour accéder à la file des messages.
         Attend l'arriver d'un nouveau message.
-        Retire le message le plus ancien de la liste.
+        Retire le message le plus ancien de la file.
 
         :return: premier message de la classe ``Messagerie``.
         """
 
         with cls.nouveau_message:
-            while not len(cls.messages):
+            while not cls.messages:
                 cls.nouveau_message.wait()
-            return cls.messages.pop(0)
+            return cls.messages.popleft()
 
     @classmethod
     def effacer(cls) -> None:
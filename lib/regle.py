@@ -9,9 +9,9 @@ Ce module définit les règles du labryinthe.
   ``gagner_une_partie()``, ``transformer_un_obstacle()``
 """
 
-from typing import Set, Callable, Tuple, Dict, List, Optional, Type, cast
+from typing import Callable, Tuple, Dict, List, Optional, Type, cast
 from abc import ABCMeta
-from lib.element import Obstacle, Elements, Element, Traversable, Gagnable
+from lib.element import Obstacle, Elements, Element, caracteristique_traversable, caracteristique_gagnable
 from lib.controle import Transformer
 from lib.joueur import Joueur
 
@@ -32,9 +32,31 @@ class ExceptionLabyrinthe(BaseException, metaclass=ABCMeta):
 class HorsRegles(ExceptionLabyrinthe):
     """
     Exception levée si le joueur enfreint une règle du labyrinthe.
+    Le message n'est construit qu'à l'appel de ``str()``, en complétant le ``modele`` avec les ``arguments``.
+
+    :param modele: modèle du message, selon le format de ``str.format()``.
+    :param arguments: valeurs insérées dans le modèle.
     """
 
-    pass
+    def __init__(self, modele: str = str(), *arguments: str) -> None:
+        """
+        Stocke le modèle du message et ses arguments sans les assembler.
+
+        :param modele: modèle du message, selon le format de ``str.format()``.
+        :param arguments: valeurs insérées dans le modèle.
+        """
+
+        super().__init__(modele, *arguments)
+
+    def __str__(self) -> str:
+        """
+        Assemble le message à partir du modèle et des arguments.
+
+        :return: message de l'exception.
+        """
+
+        modele, *arguments = self.args
+        return str(modele).format(*arguments)
 
 
 class PartieGagnee(ExceptionLabyrinthe):
@@ -74,23 +96,22 @@ class Etat:
         """
 
         self.coordonnees_obstacle = (joueur.coordonnees[0] + direction[0], joueur.coordonnees[1] + direction[1])
-        try:
-            self.obstacle = cast(Type[Element], grille[self.coordonnees_obstacle])
-        except KeyError:
-            self.obstacle = Elements.obstacle_par_defaut
+        self.obstacle = cast(Type[Element], grille.get(self.coordonnees_obstacle, Elements.obstacle_par_defaut))
         self.transformation = transformation
-        self.coordonnees_adversaires = [adversaire.coordonnees for adversaire in adversaires]
+        self.coordonnees_adversaires = frozenset(adversaire.coordonnees for adversaire in adversaires)
 
 
-# Les sets de regles contiennent les références des fonctions de règles
-regles_mouvement: Set[Regle] = set()
-regles_transformation: Set[Regle] = set()
+# Les listes de regles contiennent les références des fonctions de règles, dans l'ordre de leur déclaration
+regles_mouvement: List[Regle] = []
+regles_transformation: List[Regle] = []
 
 
 def verifier_regles(etat: Etat) -> None:
     """
-    Définit le set de règles à utiliser selon si le controle est un ``Mouvement`` ou une ``Transformation``.
-    Appelle les règles en leur passant l'état du labyrinthe.
+    Définit la liste de règles à utiliser selon si le controle est un ``Mouvement`` ou une ``Transformation``.
+    Appelle les règles dans l'ordre de leur déclaration en leur passant l'état du labyrinthe.
+    Les règles qui lèvent ``HorsRegles`` sont déclarées avant ``gagner_une_partie()``: une commande interdite ne peut
+    pas faire gagner la partie.
 
     :param etat: état du labyrinthe.
     """
@@ -103,23 +124,24 @@ def verifier_regles(etat: Etat) -> None:
         regle(etat)
 
 
-def lister_regles(set_de_regles: Set[Regle]) -> Callable[[Regle], Regle]:
+def lister_regles(liste_de_regles: List[Regle]) -> Callable[[Regle], Regle]:
     """
-    Construit un décorateur qui stocke une règle dans ``set_de_regles``
+    Construit un décorateur qui ajoute une règle à la fin de ``liste_de_regles``
 
-    :param set_de_regles: le set de règle à utiliser.
+    :param liste_de_regles: la liste de règles à utiliser.
     :return: décorateur.
     """
 
     def decorateur(regle: Regle) -> Regle:
         """
-        Décorateur qui stocke une règles dans un set de regles.
+        Décorateur qui ajoute une règle à une liste de regles, si elle n'y figure pas déjà.
 
         :param regle: règle à stocker.
         :return: règle sotckée.
         """
 
-        set_de_regles.add(regle)
+        if regle not in liste_de_regles:
+            liste_de_regles.append(regle)
         return regle
     return decorateur
 
@@ -133,8 +155,8 @@ def traverser_un_obstacle(etat: Etat) -> None:
     :raises HorsRegles: si l'élément n'est pas ``Traversable``.
     """
 
-    if not issubclass(etat.obstacle, Traversable):
-        raise HorsRegles("Vous ne pouvez pas traverser " + etat.obstacle.description + " !")
+    if not etat.obstacle.caracteristiques & caracteristique_traversable:
+        raise HorsRegles("Vous ne pouvez pas traverser {} !", etat.obstacle.description)
 
 
 @lister_regles(regles_mouvement)
@@ -148,9 +170,8 @@ def rencontrer_un_adversaire(etat: Etat) -> None:
     :raises HorsRegles: si un autre joueur occupe la position.
     """
 
-    for coordonnees in etat.coordonnees_adversaires:
-        if etat.coordonnees_obstacle == coordonnees:
-            raise HorsRegles("Un joueur occupe déjà " + etat.obstacle.description + " !")
+    if etat.coordonnees_obstacle in etat.coordonnees_adversaires:
+        raise HorsRegles("Un joueur occupe déjà {} !", etat.obstacle.description)
 
 
 @lister_regles(regles_mouvement)
@@ -162,7 +183,7 @@ def gagner_une_partie(etat: Etat) -> None:
     :raises PartieGagnee: si l'élément est ``Gagnable``.
     """
 
-    if issubclass(etat.obstacle, Gagnable):
+    if etat.obstacle.caracteristiques & caracteristique_gagnable:
         raise PartieGagnee()
 
 
@@ -177,5 +198,4 @@ def transformer_un_obstacle(etat: Etat) -> None:
 
     if etat.transformation:
         if not issubclass(etat.obstacle, etat.transformation):
-            raise HorsRegles("Vous ne pouvez pas " + etat.transformation.description
-                             + " " + etat.obstacle.description + " !")
+            raise HorsRegles("Vous ne pouvez pas {} {} !", etat.transformation.description, etat.obstacle.description)
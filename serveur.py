@@ -5,13 +5,18 @@ Ce fichier contient le Serveur du jeu.
 Exécutez-le avec Python pour lancer le jeu.
 """
 
-from typing import Final
+from typing import Final, Iterable, Dict, List, Tuple, Any
 import argparse
+import logging
+import logging.handlers
+import queue
+import sys
 from lib.interface_serveur import ThreadedTCPServer, Adresse
-from lib.messagerie import Messagerie
+from lib.messagerie import Messagerie, Transmission
 from lib.dossier import Dossier
 from lib.carte import Carte
-from lib.labyrinthe import Labyrinthe
+from lib.labyrinthe import Labyrinthe, Datagramme, Categorie, Message, categorie_affichage, categorie_validation_schema, \
+    categorie_validation_erreur
 
 
 def validateur_port(saisie: str) -> int:
@@ -38,6 +43,27 @@ def validateur_port(saisie: str) -> int:
         return port
 
 
+def transmettre(datagrammes: Iterable[Datagramme]) -> None:
+    """
+    Regroupe les datagrammes ``(emetteur, categorie, message)`` par destinataire, en conservant leur ordre.
+    Sérialise une seule fois chaque message ``(categorie, message)`` distinct, même s'il est diffusé à plusieurs
+    destinataires.
+    Transmet à chaque destinataire l'ensemble de ses messages en un seul envoi.
+
+    :param datagrammes: datagrammes à transmettre.
+    """
+
+    serialises: Dict[Tuple[Categorie, Message], bytes] = {}
+    envois: Dict[Any, List[bytes]] = {}
+    for destinataire, categorie, message in datagrammes:
+        contenu = (categorie, message)
+        if contenu not in serialises:
+            serialises[contenu] = Transmission.serialiser(contenu)
+        envois.setdefault(destinataire, []).append(serialises[contenu])
+    for destinataire, messages in envois.items():
+        destinataire.envoyer_brut(b''.join(messages))
+
+
 parser = argparse.ArgumentParser(formatter_class=argparse.ArgumentDefaultsHelpFormatter)
 parser.add_argument("-p", "--port", type=validateur_port, default=12800,
                     help="Le port d'écoute du Serveur.")
@@ -53,6 +79,41 @@ adresse: Final[Adresse] = ('localhost', args.port)
 # Touche saisie par un client réseau pour commencer la partie de labyrinthe
 touche_commencer: Final[str] = 'C'
 
+# Messages constants transmis à chaque nouveau joueur, sérialisés une seule fois
+messages_accueil: Final[bytes] = b''.join(Transmission.serialiser(message) for message in (
+    (categorie_validation_schema, r"[" + touche_commencer + "]"),
+    (categorie_validation_erreur, "Erreur dans la saisie."),
+    (categorie_affichage, "Entrez " + touche_commencer + " pour commencer à jouer :")))
+
+
+class DepotJournal(logging.handlers.QueueHandler):
+    """
+    Dépose les enregistrements du journal dans la file sans les formater.
+    La file reste dans le processus : le message et ses arguments sont assemblés par le Thread du ``QueueListener``, et
+    non par *Main Thread*.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Retourne l'enregistrement sans fusionner le message et ses arguments.
+
+        :param record: enregistrement du journal.
+        :return: l'enregistrement, inchangé.
+        """
+
+        return record
+
+
+# Journal de la partie: *Main Thread* dépose les messages dans ``file_journal`` sans attendre la console, le Thread du
+# ``QueueListener`` les met en forme et les affiche
+file_journal: "Final[queue.SimpleQueue[logging.LogRecord]]" = queue.SimpleQueue()
+journal: Final[logging.Logger] = logging.getLogger('serveur')
+journal.setLevel(logging.INFO)
+journal.propagate = False
+journal.addHandler(DepotJournal(file_journal))
+afficheur_journal: Final[logging.handlers.QueueListener] = logging.handlers.QueueListener(
+    file_journal, logging.StreamHandler(sys.stdout))
+
 """
 Initialise la classe ``Carte`` avec:
 
@@ -104,7 +165,7 @@ else:
     Instanciation et démarrage des Threads:
 
     - *Main Thread* reçoit les informations des Threads *RequestHandler*. C'est le seul à envoyer des messages aux clients,
-      c'est le seul à afficher des informations.
+      c'est le seul à journaliser des informations.
     - *Serveur* écoute le réseau pour accepter de nouvelles connexions.
     - Les Threads *RequestHandler* reçoivent les messages des clients et les transmettent à *Main Thread*.
     """
@@ -112,105 +173,104 @@ else:
     with ThreadedTCPServer(adresse) as serveur:
         serveur.connexion_autorisee = labyrinthe.est_ouvert()
         serveur.thread.start()
-        print("On attend les Clients sur l'adresse {}.".format(adresse))
-
-        """
-        Première boucle avant le début de partie qui autorise de nouveaux joueurs.
-        *Main Thread* récupère un message de la liste de la classe ``Messagerie`` qui contient un tuple
-        ``(émetteur, categorie, message)``.
-
-        Catégories reçues des Threads *RequestHandler*:
-
-        - ``"nouveau_joueur"``, ajoute un joueur au labyrinthe et transmet le message d'accueil.
-        - ``"quitte"``, supprime le joueur du labyrinthe.
-
-        Catégorie reçue des Clients (transmis par les Threads *RequestHandler*):
-
-        - ``"commande"``, quitte la boucle si la saisie du client est ``touche_commencer``.
-        """
-
-        while True:
-            try:
-                emetteur, categorie, message = Messagerie.obtenir()
-            except (ValueError, TypeError):
-                continue
-            if categorie == 'nouveau_joueur':
-                labyrinthe.ajouter_joueur(emetteur, emetteur.nom_joueur)
-                for _emetteur, categorie, message in labyrinthe.get_datagrammes():
-                    _emetteur.envoyer((categorie, message))
-                emetteur.envoyer(('validation_schema', r"[" + touche_commencer + "]"))
-                emetteur.envoyer(('validation_erreur', "Erreur dans la saisie."))
-                emetteur.envoyer(('affichage', "Entrez " + touche_commencer + " pour commencer à jouer :"))
-                serveur.connexion_autorisee = labyrinthe.est_ouvert()
-                print(emetteur.nom_joueur + " est connecté.")
-            elif categorie == 'quitte':
-                labyrinthe.effacer_joueur(emetteur)
-                print(emetteur.nom_joueur + " a quitté la partie.")
-            elif categorie == 'commande':
-                if message == touche_commencer:
-                    print(emetteur.nom_joueur + " a saisie '" + touche_commencer + "'.")
-                    break
-
-        """
-        Le Labyrinthe n'admet plus de nouveau joueur.
-        Transmet le schéma de validation des commandes et le message d'erreur en cas de mauvaise saisie.
-        Transmet le plateau du labyrinthe avec la position des joueurs.
-        """
-
-        serveur.connexion_autorisee = False
-        print("Début de la partie.")
-        labyrinthe.demarrer()
-        for _emetteur, categorie, message in labyrinthe.get_datagrammes():
-            _emetteur.envoyer((categorie, message))
-
-        """
-        Boucle principale:
-
-        *Main Thread* récupère un message de la liste de la classe ``Messagerie`` qui contient un tuple
-        ``(émetteur, categorie, message)``.
-
-        Catégorie reçue des Threads *RequestHandler*:
-        - ``"quitte"``, supprime le joueur du labyrinthe, informe les autres joueurs et renvoie le plateau.
-
-        Catégorie reçue des Clients (transmis par les Threads *RequestHandler*):
-        - ``"commande"``, ajoute les commandes au joueur, renvoie la liste des commandes au client réseau puis joue les
-          commandes des joueurs à tour de rôle jusqu'à leur épuisement.
-        """
-
-        while labyrinthe.mode < Labyrinthe.fin_de_partie:
-            try:
-                emetteur, categorie, message = Messagerie.obtenir()
-            except (ValueError, TypeError):
-                continue
-            if categorie == 'quitte':
-                labyrinthe.effacer_joueur(emetteur)
-                for _emetteur, categorie, message in labyrinthe.get_datagrammes():
-                    _emetteur.envoyer((categorie, message))
-                print(emetteur.nom_joueur + " a quitté la partie.")
-
-            elif categorie == 'commande':
-                labyrinthe.ajouter_commande(emetteur, message)
-                print(emetteur.nom_joueur + " a saisie '" + message + "'.")
-                labyrinthe.jouer()
-                for _emetteur, categorie, message in labyrinthe.get_datagrammes():
-                    _emetteur.envoyer((categorie, message))
-
-        """
-        Le programme quitte la boucle principale:
-
-        - un joueur a atteint une sortie.
-        - ou, après le départ d'un joueur, le nombre de joueur en lice est passé à 1 ou moins.
-
-        Transmet à chaque joueur le vainqueur de la partie et envoie ``"fin"`` aux clients réseau pour se déconnecter du
-        serveur.
-
-        Le Thread *Serveur* n'accepte plus de connexion et attend que les Thread *RequestHandler* se terminent pour s'arrêter.
-        """
-
-        print("Fin de la partie.")
-        labyrinthe.terminer()
-        for _emetteur, categorie, message in labyrinthe.get_datagrammes():
-            _emetteur.envoyer((categorie, message))
-        print("Fermeture de la connexion")
-        serveur.shutdown()
-        serveur.thread.join()
+        afficheur_journal.start()
+        try:
+            journal.info("On attend les Clients sur l'adresse %s.", adresse)
+
+            """
+            Première boucle avant le début de partie qui autorise de nouveaux joueurs.
+            *Main Thread* récupère un message de la liste de la classe ``Messagerie`` qui contient un tuple
+            ``(émetteur, categorie, message)``.
+
+            Catégories reçues des Threads *RequestHandler*:
+
+            - ``"nouveau_joueur"``, ajoute un joueur au labyrinthe et transmet le message d'accueil.
+            - ``"quitte"``, supprime le joueur du labyrinthe.
+
+            Catégorie reçue des Clients (transmis par les Threads *RequestHandler*):
+
+            - ``"commande"``, quitte la boucle si la saisie du client est ``touche_commencer``.
+            """
+
+            while True:
+                try:
+                    emetteur, categorie, message = Messagerie.obtenir()
+                except (ValueError, TypeError):
+                    continue
+                if categorie == 'nouveau_joueur':
+                    labyrinthe.ajouter_joueur(emetteur, emetteur.nom_joueur)
+                    transmettre(labyrinthe.get_datagrammes())
+                    emetteur.envoyer_brut(messages_accueil)
+                    serveur.connexion_autorisee = labyrinthe.est_ouvert()
+                    journal.info("%s est connecté.", emetteur.nom_joueur)
+                elif categorie == 'quitte':
+                    labyrinthe.effacer_joueur(emetteur)
+                    journal.info("%s a quitté la partie.", emetteur.nom_joueur)
+                elif categorie == 'commande':
+                    if message == touche_commencer:
+                        journal.info("%s a saisie '%s'.", emetteur.nom_joueur, touche_commencer)
+                        break
+
+            """
+            Le Labyrinthe n'admet plus de nouveau joueur.
+            Transmet le schéma de validation des commandes et le message d'erreur en cas de mauvaise saisie.
+            Transmet le plateau du labyrinthe avec la position des joueurs.
+            """
+
+            serveur.connexion_autorisee = False
+            journal.info("Début de la partie.")
+            labyrinthe.demarrer()
+            transmettre(labyrinthe.get_datagrammes())
+
+            """
+            Boucle principale:
+
+            *Main Thread* récupère un message de la liste de la classe ``Messagerie`` qui contient un tuple
+            ``(émetteur, categorie, message)``.
+
+            Catégorie reçue des Threads *RequestHandler*:
+            - ``"quitte"``, supprime le joueur du labyrinthe, informe les autres joueurs et renvoie le plateau.
+
+            Catégorie reçue des Clients (transmis par les Threads *RequestHandler*):
+            - ``"commande"``, ajoute les commandes au joueur, renvoie la liste des commandes au client réseau puis joue les
+              commandes des joueurs à tour de rôle jusqu'à leur épuisement.
+            """
+
+            while labyrinthe.mode < Labyrinthe.fin_de_partie:
+                try:
+                    emetteur, categorie, message = Messagerie.obtenir()
+                except (ValueError, TypeError):
+                    continue
+                if categorie == 'quitte':
+                    labyrinthe.effacer_joueur(emetteur)
+                    transmettre(labyrinthe.get_datagrammes())
+                    journal.info("%s a quitté la partie.", emetteur.nom_joueur)
+
+                elif categorie == 'commande':
+                    labyrinthe.ajouter_commande(emetteur, message)
+                    journal.info("%s a saisie '%s'.", emetteur.nom_joueur, message)
+                    labyrinthe.jouer()
+                    transmettre(labyrinthe.get_datagrammes())
+
+            """
+            Le programme quitte la boucle principale:
+
+            - un joueur a atteint une sortie.
+            - ou, après le départ d'un joueur, le nombre de joueur en lice est passé à 1 ou moins.
+
+            Transmet à chaque joueur le vainqueur de la partie et envoie ``"fin"`` aux clients réseau pour se déconnecter du
+            serveur.
+
+            Le Thread *Serveur* n'accepte plus de connexion et attend que les Thread *RequestHandler* se terminent pour
+            s'arrêter.
+            """
+
+            journal.info("Fin de la partie.")
+            labyrinthe.terminer()
+            transmettre(labyrinthe.get_datagrammes())
+            journal.info("Fermeture de la connexion")
+            serveur.shutdown()
+            serveur.thread.join()
+        finally:
+            # Vide la file du journal même si une boucle de jeu lève une exception
+            afficheur_journal.stop()
@@ -38,18 +38,19 @@ class CarteTest(unittest.TestCase):
     def parcourir_dossier(self, dossier: str) -> List[str]:
         """
         Liste les fichiers et sous-dossiers d'un dossier de manière récursive.
+        ``os.scandir()`` fournit le type de chaque entrée sans appel supplémentaire à ``stat()``.
 
         :param dossier: dossier de recherche des cartes.
         :return: liste des fichiers.
         """
 
         liste_fichiers = []
-        for fichier in os.listdir(dossier):
-            chemin = os.path.join(dossier, fichier)
-            if os.path.isdir(chemin):
-                liste_fichiers.extend(self.parcourir_dossier(chemin))
-            elif os.path.isfile(chemin):
-                liste_fichiers.append(chemin)
+        with os.scandir(dossier) as entrees:
+            for entree in entrees:
+                if entree.is_dir():
+                    liste_fichiers.extend(self.parcourir_dossier(entree.path))
+                elif entree.is_file():
+                    liste_fichiers.append(entree.path)
         return liste_fichiers
 
     def test_cartes_valides(self) -> None:
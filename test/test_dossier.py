@@ -6,7 +6,7 @@ Ce module contient la classe ``DossierTest``.
 Les tests unitaires de la classe ``Dossier`` utilisent les fichiers du dossier *test dossier*.
 """
 
-from typing import Final, List, Set, Any
+from typing import Final, ClassVar, Dict, List, Set, Any
 from lib.dossier import Dossier
 import os
 import unittest
@@ -58,44 +58,57 @@ class DossierTest(unittest.TestCase):
     Test case utilisé pour tester les fonctions du module **dossier**.
     """
 
-    def setUp(self) -> None:
+    liste_fichiers: ClassVar[List[str]]
+    fichiers_par_extension: ClassVar[Dict[str, List[str]]]
+    extensions: ClassVar[Set[str]]
+
+    @classmethod
+    def setUpClass(cls) -> None:
         """
-        Avant chaque test, charge le jeu de fichiers du dossier *test dossier*.
-        Charge les extensions des fichiers du dossier *test dossier*.
+        Avant les tests, charge une seule fois le jeu de fichiers du dossier *test dossier*.
+        Regroupe les fichiers du dossier *test dossier* par extension, et charge ces extensions.
+        Les tests ne modifient pas ces listes.
         """
 
-        self.liste_fichiers = self.__parcourir_dossier(dossier_de_test)
-        self.extensions = self.__parcourir_extensions()
+        cls.liste_fichiers = cls.__parcourir_dossier(dossier_de_test)
+        cls.fichiers_par_extension = cls.__grouper_par_extension()
+        cls.extensions = set(cls.fichiers_par_extension)
 
-    def __parcourir_dossier(self, dossier: str) -> List[str]:
+    @classmethod
+    def __parcourir_dossier(cls, dossier: str) -> List[str]:
         """
         Liste les fichiers et sous-dossiers d'un dossier de manière récursive.
+        ``os.scandir()`` fournit le type de chaque entrée sans appel supplémentaire à ``stat()``, seule la taille des
+        fichiers en nécessite un.
 
         :param dossier: dossier de recherche des cartes.
         :return: liste des fichiers.
         """
 
         liste_fichiers = []
-        for fichier in os.listdir(dossier):
-            chemin = os.path.join(dossier, fichier)
-            if os.path.isdir(chemin):
-                liste_fichiers.extend(self.__parcourir_dossier(chemin))
-            elif os.path.isfile(chemin) and os.path.getsize(chemin):
-                liste_fichiers.append(chemin)
+        with os.scandir(dossier) as entrees:
+            for entree in entrees:
+                if entree.is_dir():
+                    liste_fichiers.extend(cls.__parcourir_dossier(entree.path))
+                elif entree.is_file() and entree.stat().st_size:
+                    liste_fichiers.append(entree.path)
         return liste_fichiers
 
-    def __parcourir_extensions(self) -> Set[str]:
+    @classmethod
+    def __grouper_par_extension(cls) -> Dict[str, List[str]]:
         """
-        Extrait les extensions de ``liste_fichiers``.
+        Regroupe les fichiers de ``liste_fichiers`` selon leur extension.
 
-        :return: liste des extensions des fichiers.
+        :return: dictionnaire des listes triées de fichiers, indexé par extension.
         """
 
-        extensions = set()
-        for chemin in self.liste_fichiers:
+        fichiers_par_extension: Dict[str, List[str]] = {}
+        for chemin in cls.liste_fichiers:
             _, extension = os.path.splitext(chemin)
-            extensions.add(extension)
-        return extensions
+            fichiers_par_extension.setdefault(extension, []).append(chemin)
+        for fichiers in fichiers_par_extension.values():
+            fichiers.sort()
+        return fichiers_par_extension
 
     def test_lister_les_fichiers_par_dossier(self) -> None:
         """
@@ -103,12 +116,7 @@ class DossierTest(unittest.TestCase):
         d'un dossier, et si elle renvoie le nombre juste de fichiers.
         """
 
-        for extension in self.extensions:
-            fichiers = []
-            for chemin in self.liste_fichiers:
-                if chemin.endswith(extension):
-                    fichiers.append(chemin)
-            fichiers.sort()
+        for extension, fichiers in self.fichiers_par_extension.items():
             dossier = Dossier(chemin=dossier_de_test, extension=extension)
             fichiers_test = dossier.chemins
             fichiers_test.sort()
@@ -118,29 +126,29 @@ class DossierTest(unittest.TestCase):
     def test_lister_les_fichiers_par_fichier(self) -> None:
         """
         En passant un chemin de fichier en paramètre, teste si l'instance de la classe ``Dossier`` liste le fichier indiqué.
+        Les fichiers et leur extension sont lus depuis ``fichiers_par_extension``.
         """
 
-        for fichier in self.liste_fichiers:
-            _, extension = os.path.splitext(fichier)
-            fichier_test = Dossier(chemin=fichier, extension=extension).chemins
-            self.assertEqual(fichier, *fichier_test)
+        for extension, fichiers in self.fichiers_par_extension.items():
+            for fichier in fichiers:
+                fichier_test = Dossier(chemin=fichier, extension=extension).chemins
+                self.assertEqual(fichier, *fichier_test)
 
     def test_fichier_introuvable(self) -> None:
         """
-        A l'instanciation de la classe ``Dossier``, une exception ``FileNotFoundError`` est levée si un fichier est inexistant.
-        """
-
-        with self.assertRaises(FileNotFoundError):
-            Dossier(chemin=fichier_introuvable)
+        A l'instanciation de la classe ``Dossier``, une exception ``FileNotFoundError`` est levée:
 
-    def test_extension_introuvable(self) -> None:
-        """
-        A l'instanciation de la classe ``Dossier``, une exception ``FileNotFoundError`` est levée si aucun fichier ne comporte
-        l'extension passée en paramètre.
+        - si un fichier est inexistant.
+        - si aucun fichier ne comporte l'extension passée en paramètre.
+        - si le dossier indiqué est vide.
         """
 
-        with self.assertRaises(FileNotFoundError):
-            Dossier(chemin=dossier_de_test, extension=extension_introuvable)
+        for chemin, extension in ((fichier_introuvable, '.txt'),
+                                  (dossier_de_test, extension_introuvable),
+                                  (dossier_vide, '.txt')):
+            with self.subTest(chemin=chemin, extension=extension):
+                with self.assertRaises(FileNotFoundError):
+                    Dossier(chemin=chemin, extension=extension)
 
     def test_fichier_vide(self) -> None:
         """
@@ -150,15 +158,6 @@ class DossierTest(unittest.TestCase):
         with self.assertRaises(EOFError):
             Dossier(chemin=fichier_vide)
 
-    def test_dossier_vide(self) -> None:
-        """
-        A l'instanciation de la classe ``Dossier``, une exception ``FileNotFoundError`` est levée si le dossier indiqué est
-        vide.
-        """
-
-        with self.assertRaises(FileNotFoundError):
-            Dossier(chemin=dossier_vide)
-
     def test_lire_les_fichiers(self) -> None:
         """
         La classe ``EstTrue`` passée en paramètre est instanciée pour chaque fichier du ``dossier_de_test``.
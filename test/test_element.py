@@ -4,9 +4,10 @@
 Ce module contient la classe ``ElementTest``.
 """
 
-from typing import List, Any, Dict, Tuple
+from typing import List, Any, Dict, Tuple, Type, ClassVar, cast
 from lib.element import Decryptable, Decrypte, Defaut, Traversable, Gagnable, Demarrable, Transformable, Murable, Percable,\
-    Elements, Element
+    Elements, Element, SymboleCarte, caracteristique_decrypte, caracteristique_traversable, caracteristique_gagnable, \
+    caracteristique_demarrable, caracteristique_transformable
 import unittest
 
 
@@ -15,17 +16,25 @@ class ElementTest(unittest.TestCase):
     Test case utilisé pour tester les fonctions de la classe ``Elements``.
     """
 
-    def setUp(self) -> None:
+    decryptable: ClassVar[Dict[SymboleCarte, Type[Element]]]
+    gagnable: ClassVar[Dict[SymboleCarte, Type[Element]]]
+    obstacle_par_defaut: ClassVar[Type[Element]]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Avant les tests, sauvegarde une seule fois les éléments initialisés par le module **element**.
         """
-        Avant chaque test:
 
-        - Sauvegarde les éléments initialisés par le module **element**.
-        - Efface les listes d'éléments ``Decryptable`` et ``Gagnable`` de la métaclasse ``Elements``.
+        cls.decryptable = Elements.decryptable.copy()
+        cls.gagnable = Elements.gagnable.copy()
+        cls.obstacle_par_defaut = Elements.obstacle_par_defaut
+
+    def setUp(self) -> None:
+        """
+        Avant chaque test, efface les listes d'éléments ``Decryptable`` et ``Gagnable`` de la métaclasse ``Elements``.
         """
 
-        self.decryptable = Elements.decryptable.copy()
-        self.gagnable = Elements.gagnable.copy()
-        self.obstacle_par_defaut = Elements.obstacle_par_defaut
         Elements.decryptable.clear()
         Elements.gagnable.clear()
 
@@ -47,6 +56,7 @@ class ElementTest(unittest.TestCase):
         - Si elle dérive de ``Decryptable``, teste si le dictionnaire ``decryptable`` associe le ``symbole_carte`` à la classe.
         - si elle dérive de ``Gagnable``, teste si le dictionnaire ``gagnable`` associe le ``symbole_carte`` à la classe.
         - si elle dérive de ``Defaut``, teste si l'attribut ``obstacle_par_defaut`` contient la classe.
+        - teste si chaque bit de l'attribut ``caracteristiques`` correspond à la classe *Mix-In* héritée.
         """
 
         liste_bases: List[type] = [Decryptable,
@@ -72,3 +82,9 @@ class ElementTest(unittest.TestCase):
                 self.assertIs(classe, Elements.gagnable[classe.symbole_carte])
             if issubclass(classe, Defaut):
                 self.assertIs(classe, Elements.obstacle_par_defaut)
+            for mix_in, bit in ((Decrypte, caracteristique_decrypte),
+                                (Traversable, caracteristique_traversable),
+                                (Gagnable, caracteristique_gagnable),
+                                (Demarrable, caracteristique_demarrable),
+                                (Transformable, caracteristique_transformable)):
+                self.assertEqual(issubclass(classe, mix_in), bool(cast(Type[Element], classe).caracteristiques & bit))
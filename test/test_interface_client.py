@@ -1,7 +1,7 @@
 # -*-coding:Utf-8 -*
 
 """
-Ce module contient la classe ``ValidateurTexteTest``.
+Ce module contient les classes ``ValidationTexteTest`` et ``ValidationTexteParametreTest``.
 """
 
 from lib.interface_client import ValidateurTexte, ValidationErreur, Quitter
@@ -10,7 +10,7 @@ import unittest
 
 class ValidationTexteTest(unittest.TestCase):
     """
-    Test case utilisé pour tester les fonctions de la classe ``ValidateurTexte``.
+    Test case utilisé pour tester les fonctions de la classe ``ValidateurTexte`` sans paramétrage.
     """
 
     def tearDown(self) -> None:
@@ -20,21 +20,6 @@ class ValidationTexteTest(unittest.TestCase):
 
         ValidateurTexte.effacer()
 
-    def test_bons_parametres(self) -> None:
-        """
-        Transmet les paramètres ``"validation_schema"`` et ``"validation_erreur"`` à la classe ``ValidateurTexte``.
-        Instancie la classe avec ``message`` qui contient une chaîne de caractères valide.
-        """
-
-        message = 'test'
-        liste_categorie = {
-            'validation_schema': message,
-            'validation_erreur': 'test_erreur'
-        }
-        for cle, valeur in liste_categorie.items():
-            ValidateurTexte.parametrer(cle, valeur)
-        self.assertTrue(ValidateurTexte(message))
-
     def test_pas_de_parametre(self) -> None:
         """
         Sans paramétrage préalable, instancie la classe avec ``message`` qui contient une chaîne de caractères.
@@ -45,26 +30,56 @@ class ValidationTexteTest(unittest.TestCase):
         with self.assertRaises(ValidationErreur):
             ValidateurTexte(message)
 
-    def test_mauvais_message(self) -> None:
+    def test_quitter(self) -> None:
         """
-        Transmet les paramètres ``"validation_schema"`` et ``"validation_erreur"`` à la classe ``ValidateurTexte``.
-        Instancie la classe avec ``message`` dont la chaîne de caractères n'est pas valide.
+        Instancie la classe ``ValidateurTexte`` avec ``Quitter.touche``. L'instance lève l'exception ``Quitter``.
+        """
+
+        message = Quitter.touche
+        with self.assertRaises(Quitter):
+            ValidateurTexte(message)
+
+
+class ValidationTexteParametreTest(unittest.TestCase):
+    """
+    Test case utilisé pour tester les fonctions de la classe ``ValidateurTexte`` paramétrée une seule fois pour tous les
+    tests.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Avant les tests, transmet les paramètres ``"validation_schema"`` et ``"validation_erreur"`` à la classe
+        ``ValidateurTexte``.
         """
 
-        message = 'tes*'
         liste_categorie = {
             'validation_schema': r'test',
             'validation_erreur': 'test_erreur'
         }
         for cle, valeur in liste_categorie.items():
             ValidateurTexte.parametrer(cle, valeur)
-        self.assertFalse(ValidateurTexte(message))
 
-    def test_quitter(self) -> None:
+    @classmethod
+    def tearDownClass(cls) -> None:
         """
-        Instancie la classe ``ValidateurTexte`` avec ``Quitter.touche``. L'instance lève l'exception ``Quitter``.
+        Après les tests, réinitialise la classe ``ValidateurTexte``.
         """
 
-        message = Quitter.touche
-        with self.assertRaises(Quitter):
-            ValidateurTexte(message)
+        ValidateurTexte.effacer()
+
+    def test_bons_parametres(self) -> None:
+        """
+        Instancie la classe avec ``message`` qui contient une chaîne de caractères valide.
+        """
+
+        message = 'test'
+        self.assertTrue(ValidateurTexte(message))
+
+    def test_mauvais_message(self) -> None:
+        """
+        Instancie la classe avec ``message`` dont la chaîne de caractères n'est pas valide.
+        """
+
+        message = 'tes*'
+        self.assertFalse(ValidateurTexte(message))
@@ -4,7 +4,7 @@
 Ce module contient les classes ``RequestHandlerTest`` et ``ThreadedTCPServerTest``.
 """
 
-from typing import Dict, Tuple, List, ClassVar, Final
+from typing import Tuple, List, ClassVar, Final, cast
 from lib.interface_serveur import RequestHandler, ThreadedTCPServer
 from lib.messagerie import Messagerie
 import socketserver
@@ -14,61 +14,10 @@ import unittest
 
 # Alias de type pour les adresses des clients et serveurs
 Adresse = Tuple[str, int]
-adresse: Final[Adresse] = ('localhost', 12800)
-
-
-class Serveur:
-    """
-    Crée un serveur.
-    """
-
-    def __init__(self) -> None:
-        """
-        Définit une socket.
-        Stocke la socket des clients dans un dictionnaire ``{socket: adresse}``.
-        """
-
-        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.clients: Dict[socket.socket, Adresse] = {}
-
-    def demarrer_serveur(self) -> None:
-        """
-        Démarre le serveur sur l'adresse de connexion.
-        """
-
-        self.socket.bind(adresse)
-        self.socket.listen(5)
-
-    def accepter_connexion(self) -> Tuple[socket.socket, Adresse]:
-        """
-        Accepte une connexion et stocke les informations du client.
-
-        :return: adresse du client.
-        """
-
-        client, adresse_client = self.socket.accept()
-        self.clients[client] = adresse_client
-        return client, adresse_client
-
-    def fermer_connexion(self, client: socket.socket) -> None:
-        """
-        Ferme la connexion du client et efface le client du dictionnaire.
-
-        :param client: socket client à fermer.
-        """
-
-        client.close()
-        del self.clients[client]
-
-    def arreter_serveur(self) -> None:
-        """
-        Pour toutes les connexions clientes actives, ferme la connexion.
-        Puis ferme la socket du serveur.
-        """
-
-        for client in self.clients.copy():
-            self.fermer_connexion(client)
-        self.socket.close()
+# Le port 0 laisse le système choisir un port libre pour le serveur
+adresse: Final[Adresse] = ('localhost', 0)
+# Adresse transmise à ``RequestHandler`` pour les clients connectés par ``socketpair()``
+adresse_client: Final[Adresse] = ('localhost', 0)
 
 
 class Client:
@@ -83,12 +32,14 @@ class Client:
 
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
 
-    def connecter(self) -> None:
+    def connecter(self, adresse_serveur: Adresse) -> None:
         """
         Etablit une connexion sur l'adresse du serveur.
+
+        :param adresse_serveur: adresse du serveur démarré.
         """
 
-        self.socket.connect(adresse)
+        self.socket.connect(adresse_serveur)
 
     def fermer_connexion(self) -> None:
         """
@@ -143,39 +94,40 @@ class RequestHandlerTest(unittest.TestCase):
 
     def setUp(self) -> None:
         """
-        Avant chaque test, crée et démarre un serveur.
+        Avant chaque test, initialise les listes des sockets clients et des sockets transmises à ``RequestHandler``.
         """
 
-        self.serveur: Serveur = Serveur()
-        self.serveur.demarrer_serveur()
-        self.clients: List[Client] = []
+        self.clients: List[socket.socket] = []
+        self.requetes: List[socket.socket] = []
 
     def tearDown(self) -> None:
         """
-        Après chaque test, arrête le serveur.
+        Après chaque test, ferme les sockets transmises à ``RequestHandler``.
+        Réinitialise les variables de la classe ``Messagerie``.
         """
 
-        self.serveur.arreter_serveur()
+        for requete in self.requetes:
+            requete.close()
+        Messagerie.effacer()
 
     def initier_connexion(self, nombre_de_connexions: int) -> None:
         """
         Pour le nombre de clients passé en paramètre:
 
-        - Crée un client, le connecte et stocke la socket dans la liste ``clients``.
-        - Le serveur accepte la connexion du client.
-        - Crée et démarre un daemon Thread qui instancie la classe ``RequestHandler``.
+        - Crée une paire de sockets connectées (``socketpair()``), sans passer par l'écoute d'un serveur.
+        - Stocke la socket client dans la liste ``clients``, et la socket serveur dans la liste ``requetes``.
+        - Crée et démarre un daemon Thread qui instancie la classe ``RequestHandler`` avec la socket serveur.
 
-        :param nombre_de_connexions: nombre de clients à créer et connecter au serveur.
+        :param nombre_de_connexions: nombre de clients à créer et connecter.
         """
 
         for _ in range(nombre_de_connexions):
-            client = Client()
-            client.connecter()
-            self.clients.append(client)
-            socket_client, adresse_client = self.serveur.accepter_connexion()
+            socket_client, requete = socket.socketpair()
+            self.clients.append(socket_client)
+            self.requetes.append(requete)
             handler = threading.Thread(
                 target=RequestHandler,
-                args=(socket_client, adresse_client, socketserver.ThreadingMixIn()))
+                args=(requete, adresse_client, socketserver.ThreadingMixIn()))
             handler.daemon = True
             handler.start()
 
@@ -199,7 +151,7 @@ class RequestHandlerTest(unittest.TestCase):
             self.assertEqual(('nouveau_joueur', None), (categorie, message))
             self.assertIsInstance(handler, RequestHandler)
         for client in self.clients:
-            client.fermer_connexion()
+            client.close()
         for indice in range(nombre_de_connexions):
             handler, categorie, message = Messagerie.obtenir()
             self.assertEqual(('quitte', None), (categorie, message))
@@ -211,28 +163,45 @@ class ThreadedTCPServerTest(unittest.TestCase):
     Test case utilisé pour tester les fonctions de la classe ``ThreadedTCPServer``.
     """
 
-    def setUp(self) -> None:
+    serveur: ClassVar[ThreadedTCPServer]
+
+    @classmethod
+    def setUpClass(cls) -> None:
         """
-        Avant chaque test, instancie ``ThreadedTCPServer`` avec la classe ``SimpleHandler`` en paramètre pour créer un
+        Avant les tests, instancie ``ThreadedTCPServer`` avec la classe ``SimpleHandler`` en paramètre pour créer un
         serveur.
         Démarre le Thread *Serveur*.
         """
 
+        cls.serveur = ThreadedTCPServer(adresse, classe_gestionnaire=SimpleHandler)
+        cls.serveur.thread.start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """
+        Après les tests, arrête le Thread *Serveur* et ferme sa socket.
+        """
+
+        cls.serveur.shutdown()
+        cls.serveur.thread.join()
+        cls.serveur.server_close()
+
+    def setUp(self) -> None:
+        """
+        Avant chaque test, initialise la liste des clients et refuse les connexions.
+        """
+
         self.clients: List[Client] = []
-        self.serveur: ThreadedTCPServer = ThreadedTCPServer(adresse, classe_gestionnaire=SimpleHandler)
-        self.serveur.thread.start()
+        self.serveur.connexion_autorisee = False
 
     def tearDown(self) -> None:
         """
-        Après chaque test, ferme les connexions clients et arrête le Thread *Serveur*.
+        Après chaque test, ferme les connexions clients.
         Réinitialise les variables de la classe ``SimpleHandler``.
         """
 
         for client in self.clients:
             client.fermer_connexion()
-        self.serveur.shutdown()
-        self.serveur.thread.join()
-        self.serveur.server_close()
         SimpleHandler.effacer()
 
     def initier_connexion(self, nombre_de_connexions: int) -> None:
@@ -247,7 +216,7 @@ class ThreadedTCPServerTest(unittest.TestCase):
 
         for _ in range(nombre_de_connexions):
             client = Client()
-            client.connecter()
+            client.connecter(cast(Adresse, self.serveur.server_address))
             self.clients.append(client)
 
     def test_connexions(self) -> None:
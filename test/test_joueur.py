@@ -4,7 +4,7 @@
 Ce module contient la classe ``JoueurTest``.
 """
 
-from typing import List
+from typing import List, ClassVar, Any
 from lib.joueur import Joueur, Commande
 import unittest
 
@@ -14,13 +14,15 @@ class JoueurTest(unittest.TestCase):
     Test case utilisé pour tester les fonctions de la classe ``Joueur``.
     """
 
-    def setUp(self) -> None:
+    liste_objets: ClassVar[List[Any]]
+
+    @classmethod
+    def setUpClass(cls) -> None:
         """
-        Avant chaque test, instancie un objet de la classe ``Joueur`` et crée une liste d'objets variés.
+        Avant les tests, crée une liste d'objets variés. Les tests ne modifient pas cette liste.
         """
 
-        self.joueur = Joueur('identifiant_client', 'Joueur')
-        self.liste_objets = [
+        cls.liste_objets = [
             None,           # None
             'test',         # Chaine de caractères
             1,              # entier
@@ -30,6 +32,13 @@ class JoueurTest(unittest.TestCase):
             ('test', 1),    # tuple
         ]
 
+    def setUp(self) -> None:
+        """
+        Avant chaque test, instancie un objet de la classe ``Joueur``.
+        """
+
+        self.joueur = Joueur('identifiant_client', 'Joueur')
+
     def test_ajouter_retirer_commande(self) -> None:
         """
         - Ajoute chaque objet à la liste de commandes de ``joueur`` en appelant ``ajouter_commande()``.
@@ -6,8 +6,9 @@ Ce module contient la classe ``LabyrintheTest``.
 
 from typing import Tuple, Set, List, Dict, cast, ClassVar, Any, Optional, Type
 from os import path
+from collections import Counter
 from lib.element import Obstacle, Element, Elements, Decryptable, Decrypte, Gagnable, Defaut, Demarrable, Transformable,\
-    Traversable
+    Traversable, caracteristique_decrypte, caracteristique_gagnable
 from lib.labyrinthe import Labyrinthe, Coordonnees, Grille
 from lib.joueur import Joueur
 import unittest
@@ -20,6 +21,9 @@ def construire_grille(chaine: str) -> Tuple[Grille, List[Coordonnees], Set[str]]
     - Enlève les éléments qui ne sont pas hérités de ``Decrypte``.
     - Identifie les éléments qui hérite de ``Gagnable``.
 
+    Chaque caractère est résolu une seule fois en ``(element, caracteristiques)``, puis la chaîne est parcourue en une
+    seule passe.
+
     :param chaine: chaîne de caractères.
     :return: grille de labyrinthe, liste de coordonnées des éléments gagnable, set des caractères inconnus.
     """
@@ -27,16 +31,19 @@ def construire_grille(chaine: str) -> Tuple[Grille, List[Coordonnees], Set[str]]
     grille: Grille = {}
     sorties: List[Coordonnees] = []
     caracteres_inconnus: Set[str] = set()
+    resolus: Dict[str, Tuple[Obstacle, int]] = {}
     for ordonnee, ligne in enumerate(chaine.splitlines()):
         for abscisse, caractere in enumerate(ligne):
-            if caractere not in Elements.decryptable:
-                caracteres_inconnus.add(caractere)
-            grille[(abscisse, ordonnee)] = cast(Obstacle, Elements.get_decryptable(caractere))
-    for coordonnees, element in grille.copy().items():
-        if issubclass(element, Gagnable):
-            sorties.append(coordonnees)
-        if not issubclass(element, Decrypte):
-            grille.pop(coordonnees)
+            if caractere not in resolus:
+                if caractere not in Elements.decryptable:
+                    caracteres_inconnus.add(caractere)
+                decryptable = Elements.get_decryptable(caractere)
+                resolus[caractere] = (cast(Obstacle, decryptable), decryptable.caracteristiques)
+            element, caracteristiques = resolus[caractere]
+            if caracteristiques & caracteristique_gagnable:
+                sorties.append((abscisse, ordonnee))
+            if caracteristiques & caracteristique_decrypte:
+                grille[(abscisse, ordonnee)] = element
     return grille, sorties, caracteres_inconnus
 
 
@@ -51,10 +58,11 @@ def determiner_min_max(mini: Coordonnees, maxi: Coordonnees, point: Coordonnees)
     :return: les coordonnées des nouveaux points extrêmes.
     """
 
-    min_abscisse = min(mini[0], point[0])
-    max_abscisse = max(maxi[0], point[0])
-    min_ordonnee = min(mini[1], point[1])
-    max_ordonnee = max(maxi[1], point[1])
+    abscisse, ordonnee = point
+    min_abscisse = abscisse if abscisse < mini[0] else mini[0]
+    max_abscisse = abscisse if abscisse > maxi[0] else maxi[0]
+    min_ordonnee = ordonnee if ordonnee < mini[1] else mini[1]
+    max_ordonnee = ordonnee if ordonnee > maxi[1] else maxi[1]
     return (min_abscisse, min_ordonnee), (max_abscisse, max_ordonnee)
 
 
@@ -63,20 +71,30 @@ class LabyrintheTest(unittest.TestCase):
     Test case utilisé pour tester les fonctions de la classe ``Labyrinthe``.
     """
 
-    def setUp(self) -> None:
+    decryptable: ClassVar[Dict[str, Type[Element]]]
+    gagnable: ClassVar[Dict[str, Type[Element]]]
+    obstacle_par_defaut: ClassVar[Type[Element]]
+    elements_decryptable: ClassVar[Dict[str, Type[Element]]]
+    elements_gagnable: ClassVar[Dict[str, Type[Element]]]
+    element_par_defaut: ClassVar[Type[Element]]
+
+    @classmethod
+    def setUpClass(cls) -> None:
         """
-        Avant chaque test:
+        Avant les tests:
 
         - Sauvegarde les éléments initialisés par le module **element**.
         - Efface les listes d'éléments ``Decryptable`` et ``Gagnable`` de la métaclasse ``Elements``.
         - Définit les nom, classe d'héritage et attributs des éléments nécessaires aux tests.
         - Crée et stocke les classes dans ``elements``.
         - Crée la classe ``Debutable`` et l'élément ``ElementTransformable``.
+        - Sauvegarde les éléments enregistrés par la métaclasse ``Elements`` lors de la création des classes, puis restaure
+          les éléments initiaux.
         """
 
-        self.decryptable = Elements.decryptable.copy()
-        self.gagnable = Elements.gagnable.copy()
-        self.obstacle_par_defaut = Elements.obstacle_par_defaut
+        cls.decryptable = Elements.decryptable.copy()
+        cls.gagnable = Elements.gagnable.copy()
+        cls.obstacle_par_defaut = Elements.obstacle_par_defaut
         Elements.decryptable.clear()
         Elements.gagnable.clear()
 
@@ -103,8 +121,8 @@ class LabyrintheTest(unittest.TestCase):
              {'symbole_affichage': 'F', 'symbole_carte': 'F', 'description': 'fin'},
              {'symbole_affichage': 'R', 'symbole_carte': 'R', 'description': 'traversable'}]
         elements = {}
-        for indice in range(len(noms)):
-            elements[noms[indice]] = type(noms[indice], bases[indice], dictionnaires[indice])
+        for nom, base, dictionnaire in zip(noms, bases, dictionnaires):
+            elements[nom] = type(nom, base, dictionnaire)
 
         class Debutable(Transformable):
             """
@@ -119,6 +137,22 @@ class LabyrintheTest(unittest.TestCase):
         dictionnaire = {'symbole_affichage': 'T', 'symbole_carte': 'T', 'description': 'transformable'}
         elements[nom] = Elements(nom, base, dictionnaire)
 
+        cls.elements_decryptable = Elements.decryptable.copy()
+        cls.elements_gagnable = Elements.gagnable.copy()
+        cls.element_par_defaut = Elements.obstacle_par_defaut
+        Elements.decryptable = cls.decryptable.copy()
+        Elements.gagnable = cls.gagnable.copy()
+        Elements.obstacle_par_defaut = cls.obstacle_par_defaut
+
+    def setUp(self) -> None:
+        """
+        Avant chaque test, enregistre dans la métaclasse ``Elements`` les éléments créés par ``setUpClass()``.
+        """
+
+        Elements.decryptable = self.elements_decryptable.copy()
+        Elements.gagnable = self.elements_gagnable.copy()
+        Elements.obstacle_par_defaut = self.element_par_defaut
+
     def tearDown(self) -> None:
         """
         Après chaque test, restaure les listes initiales dans la métaclasse ``Elements``.
@@ -161,18 +195,18 @@ class LabyrintheTest(unittest.TestCase):
         """
 
         nombre_joueurs: int = 10
-        liste_joueurs: Dict[int, Optional[Joueur]] = {}
         labyrinthe = Labyrinthe("D" * nombre_joueurs + "F")
-        for identifiant in range(nombre_joueurs):
-            liste_joueurs[identifiant] = labyrinthe._ajouter_joueur(identifiant, "Joueur" + str(identifiant))
-            self.assertIs(liste_joueurs[identifiant], labyrinthe.dict_client_joueur[identifiant])
-            self.assertIn(liste_joueurs[identifiant], labyrinthe.liste_joueurs)
+        liste_joueurs: Dict[int, Optional[Joueur]] = \
+            {identifiant: labyrinthe._ajouter_joueur(identifiant, "Joueur" + str(identifiant))
+             for identifiant in range(nombre_joueurs)}
+        self.assertEqual(liste_joueurs, labyrinthe.dict_client_joueur)
+        self.assertEqual(set(liste_joueurs.values()), set(labyrinthe.liste_joueurs))
         self.assertIs(None, labyrinthe._ajouter_joueur("ultime", "Dernier Joueur"))
 
-        for identifiant, joueur in liste_joueurs.items():
+        for identifiant in liste_joueurs:
             labyrinthe._effacer_joueur(identifiant)
-            self.assertNotIn(identifiant, labyrinthe.dict_client_joueur)
-            self.assertNotIn(joueur, labyrinthe.liste_joueurs)
+        self.assertTrue(set(liste_joueurs).isdisjoint(labyrinthe.dict_client_joueur))
+        self.assertTrue(set(liste_joueurs.values()).isdisjoint(labyrinthe.liste_joueurs))
 
     def test_ajouter_effacer_joueur_fin_de_partie(self) -> None:
         """
@@ -187,24 +221,25 @@ class LabyrintheTest(unittest.TestCase):
         """
 
         nombre_joueurs: int = 10
-        liste_joueurs: Dict[int, Optional[Joueur]] = {}
         labyrinthe = Labyrinthe("D" * nombre_joueurs * 2 + "F")
-        for identifiant in range(nombre_joueurs):
-            liste_joueurs[identifiant] = labyrinthe._ajouter_joueur(identifiant, "Joueur" + str(identifiant))
-            self.assertIs(liste_joueurs[identifiant], labyrinthe.dict_client_joueur[identifiant])
-            self.assertIn(liste_joueurs[identifiant], labyrinthe.liste_joueurs)
+        liste_joueurs: Dict[int, Optional[Joueur]] = \
+            {identifiant: labyrinthe._ajouter_joueur(identifiant, "Joueur" + str(identifiant))
+             for identifiant in range(nombre_joueurs)}
+        self.assertEqual(liste_joueurs, labyrinthe.dict_client_joueur)
+        self.assertEqual(set(liste_joueurs.values()), set(labyrinthe.liste_joueurs))
         labyrinthe.mode = Labyrinthe.jeu_en_cours
         self.assertIs(None, labyrinthe._ajouter_joueur("ultime", "Dernier Joueur"))
 
-        for identifiant, joueur in liste_joueurs.copy().items():
+        joueurs_effaces: Dict[int, Optional[Joueur]] = {}
+        for identifiant in liste_joueurs.copy():
             labyrinthe._effacer_joueur(identifiant)
-            liste_joueurs.pop(identifiant)
-            self.assertNotIn(identifiant, labyrinthe.dict_client_joueur)
-            self.assertNotIn(joueur, labyrinthe.liste_joueurs)
+            joueurs_effaces[identifiant] = liste_joueurs.pop(identifiant)
             if len(liste_joueurs) > 1:
                 self.assertEqual(Labyrinthe.jeu_en_cours, labyrinthe.mode)
             else:
                 break
+        self.assertTrue(set(joueurs_effaces).isdisjoint(labyrinthe.dict_client_joueur))
+        self.assertTrue(set(joueurs_effaces.values()).isdisjoint(labyrinthe.liste_joueurs))
         _, joueur = liste_joueurs.popitem()
         self.assertEqual(Labyrinthe.fin_de_partie, labyrinthe.mode)
         self.assertIs(joueur, labyrinthe.vainqueur)
@@ -292,6 +327,7 @@ class LabyrintheTest(unittest.TestCase):
         - Ajoute deux joueurs et leur assigne des coordonnées.
         - Change le mode du labyrinthe en ``jeu_en_cours``.
         - Compare la ``chaine_reference`` à la chaîne générée par ``afficher_plateau()``.
+        - Compare les plateaux du joueur et de l'adversaire générés depuis un fond commun.
 
         :raises AttributeError: si la labyrinthe n'a pas créé de joueur.
         """
@@ -317,12 +353,29 @@ class LabyrintheTest(unittest.TestCase):
         labyrinthe.mode = Labyrinthe.jeu_en_cours
         self.assertEqual(chaine_reference + "\n", labyrinthe._afficher_plateau(joueur))
 
+        # Le même fond de grille est partagé entre le joueur et l'adversaire
+        fond = labyrinthe._dessiner_fond()
+        self.assertEqual(chaine_reference + "\n", labyrinthe._afficher_plateau(joueur, fond))
+        self.assertEqual("FDT\nxOX\n", labyrinthe._afficher_plateau(adversaire, fond))
+
+    def test_afficher_plateau_symbole_trop_long(self) -> None:
+        """
+        Crée un élément décrypté dont la représentation mesure deux caractères, puis un labyrinthe qui le contient.
+        Teste si ``afficher_plateau()`` lève l'exception ``ValueError`` au lieu de décaler les lignes du plateau.
+        """
+
+        type('ElementLarge', (Element, Decrypte,), {'symbole_affichage': 'LL', 'symbole_carte': 'L', 'description': 'large'})
+        labyrinthe = Labyrinthe("FDL")
+        with self.assertRaises(ValueError):
+            labyrinthe._afficher_plateau()
+
     def test_ajouter_commande(self) -> None:
         """
         Crée un labyrinthe et ajoute un joueur. Pour chaque saisie dans la liste ``saisie``:
 
         - Ajoute les commandes au joueur.
         - Compare les commandes en ``reference`` à la liste ``commandes`` du joueur.
+        - Teste si une saisie sans commande n'ajoute aucun datagramme.
 
         :raises AttributeError: si la labyrinthe n'a pas créé de joueur.
         """
@@ -338,6 +391,10 @@ class LabyrintheTest(unittest.TestCase):
             labyrinthe.ajouter_commande("Joueur", saisie)
         self.assertEqual(reference, joueur.commandes)
 
+        labyrinthe.datagrammes.clear()
+        labyrinthe.ajouter_commande("Joueur", "")
+        self.assertEqual([], labyrinthe.datagrammes)
+
 
 class AffichageTest(unittest.TestCase):
     """
@@ -348,14 +405,22 @@ class AffichageTest(unittest.TestCase):
     extension: ClassVar[str] = ".txt"
     carte: ClassVar[str] = "sans_bord"
     chemin: ClassVar[str] = path.join(dossier_courant, "test labyrinthe/" + carte + extension)
+    chaine: ClassVar[str]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Avant les tests, lit une seule fois la ``carte``.
+        """
+
+        with open(cls.chemin, "r") as fichier:
+            cls.chaine = fichier.read()
 
     def setUp(self) -> None:
         """
         Avant chaque test, crée un labyrinthe depuis la ``carte``.
         """
-        self.chaine: str = str()
-        with open(self.chemin, "r") as fichier:
-            self.chaine = fichier.read()
+
         self.labyrinthe = Labyrinthe(self.chaine, self.carte)
 
     def test_placement_aleatoire_des_joueurs(self) -> None:
@@ -364,18 +429,19 @@ class AffichageTest(unittest.TestCase):
         - Stocke les identifiants des joueurs dans ``liste_joueurs``.
         - Débute une partie pour affecter une position à chaque joueur.
         - Collecte les coordonnées de chaque joueur dans ``liste_coordonnees``.
-        - Teste si la liste triée des coordonnées est égale à la liste triée des positions de départ possibles.
+        - Teste si les coordonnées sont les positions de départ possibles, chacune en même nombre (``Counter``).
         """
 
-        liste_identifiants: List[Any] = []
-        for indice in range(len(self.labyrinthe.departs)):
-            self.labyrinthe.ajouter_joueur("identifiant" + str(indice), "Joueur" + str(indice))
-            liste_identifiants.append("identifiant" + str(indice))
+        nombre_joueurs = len(self.labyrinthe.departs)
+        liste_identifiants: List[Any] = ["identifiant" + str(indice) for indice in range(nombre_joueurs)]
+        noms = ["Joueur" + str(indice) for indice in range(nombre_joueurs)]
+        for identifiant, nom in zip(liste_identifiants, noms):
+            self.labyrinthe.ajouter_joueur(identifiant, nom)
         self.labyrinthe.demarrer()
         liste_coordonnees = []
         for identifiant in liste_identifiants:
             liste_coordonnees.append(self.labyrinthe.dict_client_joueur[identifiant].coordonnees)
-        self.assertEqual(sorted(liste_coordonnees), sorted(self.labyrinthe.departs))
+        self.assertEqual(Counter(liste_coordonnees), Counter(self.labyrinthe.departs))
 
     def test_deroulement_du_jeu(self) -> None:
         """
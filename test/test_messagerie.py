@@ -1,10 +1,10 @@
 # -*-coding:Utf-8 -*
 
 """
-Ce module contient les classes ``TransmissionTest`` et ``MessagerieTest``.
+Ce module contient les classes ``TransmissionTest``, ``TransmissionTCPTest`` et ``MessagerieTest``.
 """
 
-from typing import Optional, ClassVar
+from typing import Optional, ClassVar, List, Any
 from lib.messagerie import Transmission, Messagerie, ConnectionFermee
 import socket
 import threading
@@ -17,14 +17,15 @@ class ClientServeur:
     """
 
     hote: ClassVar[str] = 'localhost'
-    port: ClassVar[int] = 12800
 
     def __init__(self) -> None:
         """
         Définit une socket (client ou serveur).
+        Le port est choisi par le système au démarrage du serveur.
         """
 
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.port = 0
 
 
 class Serveur(ClientServeur):
@@ -42,10 +43,13 @@ class Serveur(ClientServeur):
 
     def demarrer_serveur(self) -> None:
         """
-        Démarre le serveur sur l'adresse de connexion.
+        Démarre le serveur sur un port libre choisi par le système (port 0), puis stocke ce port dans ``port``.
+        Aucun port fixe n'est réservé : un serveur précédent dont les connexions sont en attente (``TIME_WAIT``) ne
+        bloque pas le démarrage.
         """
 
-        self.socket.bind((self.hote, self.port))
+        self.socket.bind((self.hote, 0))
+        self.port = self.socket.getsockname()[1]
         self.socket.listen(5)
 
     def accepter_connexion(self) -> socket.socket:
@@ -76,11 +80,14 @@ class Client(ClientServeur):
     Crée un client.
     """
 
-    def connecter(self) -> None:
+    def connecter(self, port: int) -> None:
         """
         Etablit une connexion sur l'adresse de connexion.
+
+        :param port: port du serveur démarré.
         """
 
+        self.port = port
         self.socket.connect((self.hote, self.port))
 
     def fermer_connexion(self) -> None:
@@ -91,20 +98,31 @@ class Client(ClientServeur):
         self.socket.close()
 
 
+class TransmissionCourte(Transmission):
+    """
+    Classe ``Transmission`` dont l'entête ne mesure qu'un octet.
+    """
+
+    longueur_entete: ClassVar[int] = 1
+
+
 class TransmissionTest(unittest.TestCase):
     """
     Test case utilisé pour tester les fonctions de la classe ``Transmission``.
+    Le client et le serveur sont les deux extrémités d'une paire de sockets connectées (``socketpair()``), sans écoute
+    réseau.
     """
 
-    def setUp(self) -> None:
+    liste_objets: ClassVar[List[Any]]
+
+    @classmethod
+    def setUpClass(cls) -> None:
         """
-        Avant chaque test, crée un serveur et un client.
-        Charge une liste d'objets variés qui pourront être transmis du client au serveur.
+        Avant les tests, crée une liste d'objets variés qui pourront être transmis du client au serveur. Les tests ne
+        modifient pas cette liste.
         """
 
-        self.serveur = Serveur()
-        self.client = Client()
-        self.liste_objets = [
+        cls.liste_objets = [
             None,           # None
             'test',         # Chaîne de caractères
             1,              # entier
@@ -114,84 +132,131 @@ class TransmissionTest(unittest.TestCase):
             ('test', 1),    # tuple
         ]
 
+    def setUp(self) -> None:
+        """
+        Avant chaque test, crée une paire de sockets connectées pour le client et le serveur.
+        """
+
+        self.socket_client, self.socket_serveur = socket.socketpair()
+
     def tearDown(self) -> None:
         """
-        Après chaque test, ferme les connexions client et serveur.
+        Après chaque test, ferme les sockets client et serveur.
         """
 
-        self.client.fermer_connexion()
-        self.serveur.arreter_serveur()
+        self.socket_client.close()
+        self.socket_serveur.close()
 
     def test_emission_trop_gros_objet(self) -> None:
         """
         Crée un objet dont l'entête ne peut pas stocker la taille. Tente de transmettre l'objet mais échoue à créer
         l'entête. L'exception ``OverflowError`` est levée.
+        La classe ``TransmissionCourte`` réduit l'entête à un octet: l'objet n'occupe que quelques centaines d'octets.
         """
 
-        transmission_client = Transmission(self.client.socket)
+        transmission_client = TransmissionCourte(self.socket_client)
         objet = 'a' * (2 ** (transmission_client.longueur_entete * 8))
         with self.assertRaises(OverflowError):
             transmission_client.envoyer(objet)
-        del objet
 
     def test_emission_reception(self) -> None:
         """
-        Démarre le serveur et le client. Le serveur accepte la connexion du client.
         Le client transmet chaque objet de la liste au serveur. Teste si l'objet à transmis par le client est identique
         à l'objet reçu par le serveur.
+        Chaque objet est un sous-test (``subTest``) sur la même paire de sockets : un échec indique l'objet concerné.
         """
 
-        self.serveur.demarrer_serveur()
-        self.client.connecter()
-        socket_serveur = self.serveur.accepter_connexion()
-        transmission_client = Transmission(self.client.socket)
-        transmission_serveur = Transmission(socket_serveur)
+        transmission_client = Transmission(self.socket_client)
+        transmission_serveur = Transmission(self.socket_serveur)
+        for objet in self.liste_objets:
+            with self.subTest(objet=objet):
+                transmission_client.envoyer(objet)
+                self.assertEqual(objet, transmission_serveur.recevoir())
+
+    def test_emission_reception_brut(self) -> None:
+        """
+        Le client sérialise chaque objet de la liste avec ``serialiser()`` et transmet les messages concaténés en un seul
+        envoi. Teste si les objets reçus un à un par le serveur sont identiques aux objets sérialisés par le client.
+        """
+
+        transmission_client = Transmission(self.socket_client)
+        transmission_serveur = Transmission(self.socket_serveur)
+        transmission_client.envoyer_brut(b''.join(Transmission.serialiser(objet) for objet in self.liste_objets))
         for objet in self.liste_objets:
-            transmission_client.envoyer(objet)
             self.assertEqual(objet, transmission_serveur.recevoir())
 
     def test_reception_serveur_clos(self) -> None:
         """
-        Démarre le serveur et le client. Le serveur accepte la connexion du client.
-        Ferme le serveur. Le serveur tente de recevoir un message et lève l'exception ``OSError``.
+        Ferme la socket du serveur. Le serveur tente de recevoir un message et lève l'exception ``OSError``.
         """
 
-        self.serveur.demarrer_serveur()
-        self.client.connecter()
-        socket_serveur = self.serveur.accepter_connexion()
-        transmission_serveur = Transmission(socket_serveur)
-        self.serveur.arreter_serveur()
+        transmission_serveur = Transmission(self.socket_serveur)
+        self.socket_serveur.close()
         with self.assertRaises(OSError):
             transmission_serveur.recevoir()
 
     def test_reception_client_clos(self) -> None:
         """
-        Démarre le serveur et le client. Le serveur accepte la connexion du client.
         Ferme le client. Le serveur tente de recevoir un message et lève l'exception ``ConnectionFermee`` (l'entête
         reçue est vide).
         """
 
-        self.serveur.demarrer_serveur()
-        self.client.connecter()
-        socket_serveur = self.serveur.accepter_connexion()
-        self.client.fermer_connexion()
-        transmission_serveur = Transmission(socket_serveur)
+        self.socket_client.close()
+        transmission_serveur = Transmission(self.socket_serveur)
         with self.assertRaises(ConnectionFermee):
             transmission_serveur.recevoir()
 
     def test_reception_mauvais_format(self) -> None:
+        """
+        Le client envoie un message sans entête, puis ferme la connexion en écriture.
+        Le serveur reçoit un message incomplet et lève l'exception ``TypeError``.
+        """
+
+        transmission_serveur = Transmission(self.socket_serveur)
+        self.socket_client.send(b"test")
+        self.socket_client.shutdown(socket.SHUT_WR)
+        with self.assertRaises(TypeError):
+            transmission_serveur.recevoir()
+
+
+class TransmissionTCPTest(unittest.TestCase):
+    """
+    Test case utilisé pour tester la classe ``Transmission`` sur une véritable connexion TCP entre un client et un
+    serveur.
+    """
+
+    def setUp(self) -> None:
+        """
+        Avant chaque test, crée un serveur et un client.
+        """
+
+        self.serveur = Serveur()
+        self.client = Client()
+
+    def tearDown(self) -> None:
+        """
+        Après chaque test, ferme les connexions client et serveur.
+        """
+
+        self.client.fermer_connexion()
+        self.serveur.arreter_serveur()
+
+    def test_desactiver_nagle(self) -> None:
         """
         Démarre le serveur et le client. Le serveur accepte la connexion du client.
-        Le serveur reçoit un message sans entête et lève l'exception ``TypeError``.
+        Teste si l'option ``TCP_NODELAY`` est activée sur les sockets transmises à ``Transmission``.
+        Le client transmet un objet au serveur. Teste si l'objet reçu par le serveur est identique à l'objet transmis.
         """
 
         self.serveur.demarrer_serveur()
-        self.client.connecter()
+        self.client.connecter(self.serveur.port)
         socket_serveur = self.serveur.accepter_connexion()
+        transmission_client = Transmission(self.client.socket)
         transmission_serveur = Transmission(socket_serveur)
-        self.client.socket.send(b"test")
-        with self.assertRaises(TypeError):
-            transmission_serveur.recevoir()
+        for transmission in (transmission_client, transmission_serveur):
+            self.assertTrue(transmission.request.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY))
+        transmission_client.envoyer(('test', 1))
+        self.assertEqual(('test', 1), transmission_serveur.recevoir())
 
 
 class MessagerieTest(unittest.TestCase):
@@ -206,6 +271,22 @@ class MessagerieTest(unittest.TestCase):
 
         Messagerie.effacer()
 
+    def test_ajouter_obtenir_ordre(self) -> None:
+        """
+        Sans Thread, *ajoute* puis *obtient* alternativement chaque objet.
+        Teste si chaque objet obtenu est l'objet qui vient d'être ajouté.
+        Puis *ajoute* tous les objets avant de les *obtenir*, et teste si l'ordre d'ajout est conservé.
+        """
+
+        nombre_objets = 100
+        for objet in range(nombre_objets):
+            Messagerie.ajouter(objet)
+            self.assertEqual(objet, Messagerie.obtenir())
+
+        for objet in range(nombre_objets):
+            Messagerie.ajouter(objet)
+        self.assertEqual(list(range(nombre_objets)), [Messagerie.obtenir() for _ in range(nombre_objets)])
+
     def test_ajouter_obtenir(self) -> None:
         """
         Génère une liste d'objet à ajouter à la liste de la classe ``Messagerie``.
@@ -215,7 +296,7 @@ class MessagerieTest(unittest.TestCase):
 
         nombre_objets = 100
         liste_objets_references = [nombre for nombre in range(nombre_objets)]
-        liste_objets_obtenus = []
+        liste_objets_obtenus: List[Any] = [None] * nombre_objets
 
         def ajouter_message() -> None:
             """
@@ -231,9 +312,9 @@ class MessagerieTest(unittest.TestCase):
             Stocke les objets récupérés de la liste de la classe ``Messagerie`` dans ``liste_objets_obtenus``.
             """
 
-            for _ in range(nombre_objets):
-                liste_objets_obtenus.append(Messagerie.obtenir())
-                # print("obtenir " + str(liste_objets_obtenus[-1]))
+            for indice in range(nombre_objets):
+                liste_objets_obtenus[indice] = Messagerie.obtenir()
+                # print("obtenir " + str(liste_objets_obtenus[indice]))
 
         recepteur = threading.Thread(target=obtenir_message)
         emetteur = threading.Thread(target=ajouter_message)
@@ -4,11 +4,11 @@
 Ce module contient la classe ``RegleTest``.
 """
 
-from typing import Tuple, Dict, cast, Type, List, Any
+from typing import Tuple, Dict, cast, Type, List, Any, ClassVar
 from lib.joueur import Joueur
 from lib.element import Obstacle, Element, Elements, Decryptable, Traversable, Transformable, Gagnable
 from lib.regle import Etat, HorsRegles, PartieGagnee, traverser_un_obstacle, rencontrer_un_adversaire,\
-    transformer_un_obstacle, gagner_une_partie
+    transformer_un_obstacle, gagner_une_partie, verifier_regles
 import unittest
 
 # Alias de types
@@ -37,22 +37,31 @@ class RegleTest(unittest.TestCase):
     ``transformer_un_obstacle()`` et ``gagner_une_partie()``.
     """
 
-    def setUp(self) -> None:
+    decryptable: ClassVar[Dict[str, Type[Element]]]
+    gagnable: ClassVar[Dict[str, Type[Element]]]
+    obstacle_par_defaut: ClassVar[Type[Element]]
+    elements_decryptable: ClassVar[Dict[str, Type[Element]]]
+    elements_gagnable: ClassVar[Dict[str, Type[Element]]]
+    element_par_defaut: ClassVar[Type[Element]]
+    MixInTransformation: ClassVar[Type[Transformable]]
+
+    @classmethod
+    def setUpClass(cls) -> None:
         """
-        Avant chaque test:
+        Avant les tests:
 
         - Sauvegarde les éléments initialisés par le module **element**.
         - Efface les listes d'éléments ``Decryptable`` et ``Gagnable`` de la métaclasse ``Elements``.
         - Définit les nom, classe d'héritage et attributs des éléments nécessaires aux tests.
         - Crée et stocke les classes dans ``elements``.
         - Crée l'élément ``ElementTransformable``.
-        - Instancie la classe ``Joueur`` pour créer un joueur aux coordonées (0, 0).
-        - Instancie la classe ``Joueur`` pour créer un adversaire aux coordonnées (1, 0).
+        - Sauvegarde les éléments enregistrés par la métaclasse ``Elements`` lors de la création des classes, puis restaure
+          les éléments initiaux.
         """
 
-        self.decryptable = Elements.decryptable.copy()
-        self.gagnable = Elements.gagnable.copy()
-        self.obstacle_par_defaut = Elements.obstacle_par_defaut
+        cls.decryptable = Elements.decryptable.copy()
+        cls.gagnable = Elements.gagnable.copy()
+        cls.obstacle_par_defaut = Elements.obstacle_par_defaut
         Elements.decryptable.clear()
         Elements.gagnable.clear()
 
@@ -60,7 +69,7 @@ class RegleTest(unittest.TestCase):
         base = (Transformable,)
         dictionnaire = {'description': "transformer"}
 
-        self.MixInTransformation = cast(Type[Transformable], type(nom, base, dictionnaire))
+        cls.MixInTransformation = cast(Type[Transformable], type(nom, base, dictionnaire))
 
         noms: List[str] = ['ElementObstacle',
                            'ElementSol',
@@ -69,7 +78,7 @@ class RegleTest(unittest.TestCase):
         bases: List[Tuple[type, ...]] = [(Element, Decryptable,),
                                          (Element, Decryptable, Traversable,),
                                          (Element, Gagnable,),
-                                         (Element, Decryptable, self.MixInTransformation,)]
+                                         (Element, Decryptable, cls.MixInTransformation,)]
         dictionnaires: List[Dict[str, Any]] = \
             [{'symbole_affichage': 'X', 'symbole_carte': 'X', 'description': "l'obstacle"},
              {'symbole_affichage': ' ', 'symbole_carte': ' ', 'description': "l'espace"},
@@ -81,7 +90,27 @@ class RegleTest(unittest.TestCase):
 
         # Pour éviter les références circulaires, le membre ``transformee`` de MixInTransformation est défini après les classes
         # d'éléments
-        self.MixInTransformation.transformee = elements['ElementTransformable']
+        cls.MixInTransformation.transformee = elements['ElementTransformable']
+
+        cls.elements_decryptable = Elements.decryptable.copy()
+        cls.elements_gagnable = Elements.gagnable.copy()
+        cls.element_par_defaut = Elements.obstacle_par_defaut
+        Elements.decryptable = cls.decryptable.copy()
+        Elements.gagnable = cls.gagnable.copy()
+        Elements.obstacle_par_defaut = cls.obstacle_par_defaut
+
+    def setUp(self) -> None:
+        """
+        Avant chaque test:
+
+        - Enregistre dans la métaclasse ``Elements`` les éléments créés par ``setUpClass()``.
+        - Instancie la classe ``Joueur`` pour créer un joueur aux coordonées (0, 0).
+        - Instancie la classe ``Joueur`` pour créer un adversaire aux coordonnées (1, 0).
+        """
+
+        Elements.decryptable = self.elements_decryptable.copy()
+        Elements.gagnable = self.elements_gagnable.copy()
+        Elements.obstacle_par_defaut = self.element_par_defaut
 
         self.joueur = Joueur('identifiant_client', 'Joueur')
         self.joueur.coordonnees = (0, 0)
@@ -103,7 +132,7 @@ class RegleTest(unittest.TestCase):
         - Crée un état de labyrinthe avec un déplacement du Joueur en (1, 0).
         - Teste si la règle retourne une exception.
         - Crée un état de labyrinthe avec un déplacement du Joueur en (0, 1).
-        - Teste si la règle retourne une exception.
+        - Teste si la règle retourne une exception et son message.
         """
 
         grille = construire_grille("  \n"
@@ -114,8 +143,9 @@ class RegleTest(unittest.TestCase):
 
         direction = (0, 1)
         instantane = Etat(direction, None, grille, self.joueur, [])
-        with self.assertRaises(HorsRegles):
+        with self.assertRaises(HorsRegles) as contexte:
             traverser_un_obstacle(instantane)
+        self.assertEqual("Vous ne pouvez pas traverser l'obstacle !", str(contexte.exception))
 
     def test_rencontrer_un_adversaire(self) -> None:
         """
@@ -198,3 +228,23 @@ class RegleTest(unittest.TestCase):
         instantane = Etat(direction, None, grille, self.joueur, [])
         with self.assertRaises(PartieGagnee):
             gagner_une_partie(instantane)
+
+    def test_verifier_regles(self) -> None:
+        """
+        - Crée une grille avec une sortie en (1, 0), occupée par l'adversaire.
+        - Crée un état de labyrinthe avec un déplacement du Joueur en (1, 0).
+        - Teste si les règles lèvent ``HorsRegles`` avant ``PartieGagnee``.
+        - Crée un état de labyrinthe avec un déplacement du Joueur en (1, 0), sans adversaire.
+        - Teste si les règles lèvent ``PartieGagnee``.
+        """
+
+        grille = construire_grille(" F\n"
+                                   "  ")
+        direction = (1, 0)
+        instantane = Etat(direction, None, grille, self.joueur, [self.adversaire])
+        with self.assertRaises(HorsRegles):
+            verifier_regles(instantane)
+
+        instantane = Etat(direction, None, grille, self.joueur, [])
+        with self.assertRaises(PartieGagnee):
+            verifier_regles(instantane)